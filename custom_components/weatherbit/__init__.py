@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
 import homeassistant.helpers.device_registry as dr
+import homeassistant.util.dt as dt_util
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_ID,
@@ -13,9 +17,9 @@ from homeassistant.const import (
     CONF_LONGITUDE,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util.unit_system import (
     METRIC_SYSTEM,
 )
@@ -23,7 +27,6 @@ from pyweatherbitdata import (
     RequestError,
     InvalidApiKey,
     ResultError,
-    WeatherBitApiClient,
 )
 from pyweatherbitdata.data import (
     BaseDataDescription,
@@ -31,21 +34,59 @@ from pyweatherbitdata.data import (
     ObservationDescription,
 )
 
+from .adaptive import WeatherBitActivityTracker
+from .alerts import WeatherBitAlerts
+from .api import WeatherBitApi, WeatherBitClientRegistry, async_get_registry
+from .cadence import WeatherBitPublishCadence
 from .const import (
+    ADAPTIVE_MIN_INTERVAL,
+    COORDINATOR_ALERTS,
+    COORDINATOR_FORECAST,
+    COORDINATOR_HOURLY,
+    COORDINATOR_SENSORS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ALERTS,
+    DEFAULT_API_KEY_POOL,
+    DEFAULT_DAILY_CALL_BUDGET,
     DEFAULT_INTERVAL_FORECAST,
+    DEFAULT_HOURLY_FORECAST,
+    DEFAULT_HOURLY_FORECAST_HOURS,
+    DEFAULT_INTERPOLATION,
     DEFAULT_INTERVAL_SENSORS,
+    DEFAULT_SHARE_RADIUS,
     DOMAIN,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ALERTS,
+    CONF_ALERT_DESCRIPTIONS,
+    CONF_API_KEY_POOL,
+    CONF_BASE_URL,
+    CONF_DAILY_CALL_BUDGET,
     CONF_FORECAST_LANGUAGE,
+    CONF_HOURLY_FORECAST,
+    CONF_HOURLY_FORECAST_HOURS,
+    CONF_INTERPOLATION,
     CONF_INTERVAL_FORECAST,
     CONF_INTERVAL_SENSORS,
+    CONF_SHARE_RADIUS,
+    CONF_STATION,
     CONF_UNIT_SYSTEM_IMPERIAL,
     CONF_UNIT_SYSTEM_METRIC,
     CONFIG_OPTIONS,
     DEFAULT_BRAND,
+    LIVE_OPTIONS,
+    STATION_DATA_MAX_AGE,
     WEATHERBIT_API_VERSION,
     WEATHERBIT_PLATFORMS,
 )
+from .coordinator import (
+    WeatherBitAlertsCoordinator,
+    WeatherBitDataUpdateCoordinator,
+    WeatherBitForecastCoordinator,
+)
+from .forecast import WeatherBitHourlyForecast
+from .interpolation import WeatherBitInterpolator
 from .models import WeatherBitEntryData
+from .store import WeatherBitDataStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,7 +110,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the WeatherFlow config entries."""
     _async_import_options_from_data_if_missing(hass, entry)
 
-    session = async_create_clientsession(hass)
+    registry = async_get_registry(hass)
+    key_client = registry.async_acquire(
+        entry.data[CONF_API_KEY], entry.entry_id, _get_pool_keys(entry)
+    )
+    entry.async_on_unload(
+        partial(registry.async_release, entry.data[CONF_API_KEY], entry.entry_id)
+    )
+    await key_client.scheduler.async_load()
+
     unit_system = (
         CONF_UNIT_SYSTEM_METRIC
         # if hass.config.units.is_metric
@@ -77,23 +126,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         else CONF_UNIT_SYSTEM_IMPERIAL
     )
 
-    weatherbitapi = WeatherBitApiClient(
-        entry.data[CONF_API_KEY],
+    weatherbitapi = WeatherBitApi(
+        key_client,
         entry.data[CONF_LATITUDE],
         entry.data[CONF_LONGITUDE],
         units=unit_system,
         language=entry.options[CONF_FORECAST_LANGUAGE],
-        homeassistant=True,
-        session=session,
+        base_url=entry.data.get(CONF_BASE_URL),
     )
 
+    store = WeatherBitDataStore(hass, entry.entry_id)
+    await store.async_load()
+    _async_track_calls(entry, weatherbitapi, store)
+    _async_use_handoff(registry, entry, weatherbitapi, store)
+
     try:
-        await weatherbitapi.initialize()
+        if CONF_STATION in entry.data:
+            weatherbitapi.restore_station_data(
+                BaseDataDescription(**entry.data[CONF_STATION]),
+                store.async_get_is_night(),
+            )
+        else:
+            # Entries created before the station was saved in the entry data.
+            await weatherbitapi.initialize()
+            store.async_set_station(weatherbitapi.station_data, weatherbitapi.is_night)
+            hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, CONF_STATION: asdict(weatherbitapi.station_data)},
+            )
         station_data: BaseDataDescription = weatherbitapi.station_data
 
-    except InvalidApiKey:
-        _LOGGER.debug("The API Key is not valid. Please re-install the integration.")
-        return False
+    except InvalidApiKey as err:
+        # Raised rather than returning False, so the key client is released.
+        raise ConfigEntryError(
+            "The API Key is not valid. Please re-install the integration."
+        ) from err
     except ResultError as notreadyerror:
         _LOGGER.error(
             "Data returned from WeatherBit. But empty or in unexpected format."
@@ -106,52 +173,196 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if entry.unique_id is None:
         hass.config_entries.async_update_entry(entry, unique_id=station_data.key)
 
+    _async_share_nearby(entry, weatherbitapi)
+
     async def async_update_data():
         """Obtain the latest data from WeatherFlow."""
-        try:
-            data: ObservationDescription = await weatherbitapi.update_sensors()
+        if coordinator.data is None and (
+            data := _async_get_stored_data(
+                store, COORDINATOR_SENSORS, coordinator, weatherbitapi
+            )
+        ):
             return data
-
+        try:
+            data: ObservationDescription = await weatherbitapi.update_sensors(
+                max_age=coordinator.update_interval
+            )
         except (ResultError, RequestError) as err:
             raise UpdateFailed(f"Error while retreiving data: {err}") from err
 
+        if data is not None:
+            _async_set_stored_data(store, COORDINATOR_SENSORS, data, weatherbitapi)
+            now = dt_util.utcnow()
+            weatherbitapi.stats.async_record_observation(
+                cadence.async_add_observation(data, now)
+            )
+            if activity is not None:
+                key_client.scheduler.async_set_weight(
+                    entry.entry_id,
+                    COORDINATOR_SENSORS,
+                    activity.async_add_observation(
+                        data, getattr(forecast_coordinator.data, "pop", None)
+                    ),
+                )
+            # The scheduler has just set the interval for the budget. Poll
+            # just after the publish following it, to get a new observation.
+            if next_poll := cadence.async_next_poll(now, coordinator.update_interval):
+                coordinator.update_interval = next_poll
+        return data
+
     async def async_update_forecast():
         """Obtain the latest forecast from WeatherFlow."""
-        try:
-            data: ForecastDescription = await weatherbitapi.update_forecast()
+        if forecast_coordinator.data is None and (
+            data := _async_get_stored_data(
+                store, COORDINATOR_FORECAST, forecast_coordinator, weatherbitapi
+            )
+        ):
             return data
+        try:
+            data: ForecastDescription = await weatherbitapi.update_forecast(
+                max_age=forecast_coordinator.update_interval
+            )
+        except (ResultError, RequestError) as err:
+            raise UpdateFailed(f"Error while retreiving data: {err}") from err
 
+        if data is not None:
+            _async_set_stored_data(store, COORDINATOR_FORECAST, data, weatherbitapi)
+        return data
+
+    async def async_update_hourly_forecast():
+        """Obtain the latest hourly forecast from WeatherFlow."""
+        if hourly_coordinator.data is None and (
+            data := _async_get_stored_data(
+                store, COORDINATOR_HOURLY, hourly_coordinator, weatherbitapi
+            )
+        ):
+            return data
+        try:
+            data: WeatherBitHourlyForecast = await weatherbitapi.update_hourly_forecast(
+                entry.options.get(
+                    CONF_HOURLY_FORECAST_HOURS, DEFAULT_HOURLY_FORECAST_HOURS
+                ),
+                max_age=hourly_coordinator.update_interval,
+            )
         except (ResultError, RequestError) as err:
             raise UpdateFailed(f"Error while retreiving data: {err}") from err
 
+        _async_set_stored_data(store, COORDINATOR_HOURLY, data, weatherbitapi)
+        return data
 
     unit_descriptions = await weatherbitapi.load_unit_system()
 
-    coordinator = DataUpdateCoordinator(
+    daily_budget = entry.options.get(CONF_DAILY_CALL_BUDGET, DEFAULT_DAILY_CALL_BUDGET)
+    sensor_interval = timedelta(
+        minutes=entry.options.get(CONF_INTERVAL_SENSORS, DEFAULT_INTERVAL_SENSORS)
+    )
+    cadence = WeatherBitPublishCadence()
+    activity: WeatherBitActivityTracker | None = None
+    sensor_min_interval = sensor_interval
+    if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        # The budget decides how often to poll, down to the adaptive minimum.
+        activity = WeatherBitActivityTracker(weatherbitapi.cnv)
+        sensor_min_interval = ADAPTIVE_MIN_INTERVAL
+    forecast_interval = timedelta(
+        minutes=entry.options.get(CONF_INTERVAL_FORECAST, DEFAULT_INTERVAL_FORECAST)
+    )
+
+    coordinator = WeatherBitDataUpdateCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
         update_method=async_update_data,
-        update_interval=timedelta(
-            minutes=entry.options.get(CONF_INTERVAL_SENSORS, DEFAULT_INTERVAL_SENSORS)
-        ),
+        update_interval=sensor_interval,
+        stats=weatherbitapi.stats,
+    )
+    entry.async_on_unload(
+        key_client.scheduler.async_register(
+            entry.entry_id,
+            COORDINATOR_SENSORS,
+            coordinator,
+            sensor_min_interval,
+            daily_budget,
+        )
     )
-    await coordinator.async_config_entry_first_refresh()
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
 
-    forecast_coordinator = DataUpdateCoordinator(
+    forecast_coordinator = WeatherBitForecastCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
         update_method=async_update_forecast,
-        update_interval=timedelta(
-            minutes=entry.options.get(CONF_INTERVAL_FORECAST, DEFAULT_INTERVAL_FORECAST)
-        ),
+        update_interval=forecast_interval,
+        stats=weatherbitapi.stats,
+    )
+    entry.async_on_unload(
+        key_client.scheduler.async_register(
+            entry.entry_id,
+            COORDINATOR_FORECAST,
+            forecast_coordinator,
+            forecast_interval,
+            daily_budget,
+        )
+    )
+
+    hourly_coordinator: WeatherBitDataUpdateCoordinator | None = None
+    if entry.options.get(CONF_HOURLY_FORECAST, DEFAULT_HOURLY_FORECAST):
+        hourly_coordinator = WeatherBitDataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_method=async_update_hourly_forecast,
+            update_interval=forecast_interval,
+            stats=weatherbitapi.stats,
+        )
+        entry.async_on_unload(
+            key_client.scheduler.async_register(
+                entry.entry_id,
+                COORDINATOR_HOURLY,
+                hourly_coordinator,
+                forecast_interval,
+                daily_budget,
+            )
+        )
+
+    alerts_coordinator: WeatherBitAlertsCoordinator | None = None
+    if entry.options.get(CONF_ALERTS, DEFAULT_ALERTS):
+        alerts_coordinator = _async_create_alerts_coordinator(
+            hass, entry, weatherbitapi, store, sensor_interval, daily_budget
+        )
+
+    # Only the observation is needed to set up the entities. The forecasts are
+    # fetched at the same time and may finish after the platforms are set up.
+    entry.async_create_background_task(
+        hass,
+        forecast_coordinator.async_refresh(),
+        f"{DOMAIN} forecast first refresh {entry.title}",
     )
-    await forecast_coordinator.async_config_entry_first_refresh()
-    if not forecast_coordinator.last_update_success:
-        raise ConfigEntryNotReady
+    if hourly_coordinator is not None:
+        entry.async_create_background_task(
+            hass,
+            hourly_coordinator.async_refresh(),
+            f"{DOMAIN} hourly forecast first refresh {entry.title}",
+        )
+    await coordinator.async_config_entry_first_refresh()
+
+    interpolator: WeatherBitInterpolator | None = None
+    if hourly_coordinator is not None and entry.options.get(
+        CONF_INTERPOLATION, DEFAULT_INTERPOLATION
+    ):
+        interpolator = WeatherBitInterpolator(weatherbitapi.cnv)
+        interpolator.async_set_forecast(hourly_coordinator.data)
+        interpolator.async_set_observation(coordinator.data)
+        # Added before the entities, so the estimates are updated first.
+        entry.async_on_unload(
+            coordinator.async_add_listener(
+                lambda: interpolator.async_set_observation(coordinator.data)
+            )
+        )
+        entry.async_on_unload(
+            hourly_coordinator.async_add_listener(
+                lambda: interpolator.async_set_forecast(hourly_coordinator.data)
+            )
+        )
+        entry.async_on_unload(interpolator.async_start(hass))
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = WeatherBitEntryData(
         coordinator=coordinator,
@@ -159,6 +370,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         weatherbitapi=weatherbitapi,
         station_data=station_data,
         unit_descriptions=unit_descriptions,
+        store=store,
+        hourly_coordinator=hourly_coordinator,
+        alerts_coordinator=alerts_coordinator,
+        activity=activity,
+        cadence=cadence,
+        interpolator=interpolator,
+        options=dict(entry.options),
     )
 
     await _async_get_or_create_nvr_device_in_registry(hass, entry, station_data)
@@ -166,9 +384,174 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
+    refresh_station = partial(_async_refresh_station, hass, entry, weatherbitapi, store)
+    station_age = store.async_get_station_age()
+    if station_age is None or station_age >= STATION_DATA_MAX_AGE:
+        entry.async_create_background_task(
+            hass, refresh_station(), f"{DOMAIN} station refresh {entry.title}"
+        )
+    entry.async_on_unload(
+        async_track_time_interval(hass, refresh_station, STATION_DATA_MAX_AGE)
+    )
+
     return True
 
 
+@callback
+def _async_share_nearby(entry: ConfigEntry, weatherbitapi: WeatherBitApi) -> None:
+    """Share data with the locations near this one, if enabled."""
+    if share_radius := entry.options.get(CONF_SHARE_RADIUS, DEFAULT_SHARE_RADIUS):
+        entry.async_on_unload(
+            weatherbitapi.async_share_nearby(entry.entry_id, share_radius)
+        )
+
+
+@callback
+def _async_use_handoff(
+    registry: WeatherBitClientRegistry,
+    entry: ConfigEntry,
+    weatherbitapi: WeatherBitApi,
+    store: WeatherBitDataStore,
+) -> None:
+    """Use what the config flow fetched, when set up right after it.
+
+    The station is saved as just refreshed, and the observation of the flow
+    is used for the first sensor update, so no call is made twice.
+    """
+    if (handoff := registry.async_pop_handoff(entry.unique_id)) is None:
+        return
+    store.async_set_station(
+        BaseDataDescription(**entry.data[CONF_STATION]), handoff.is_night
+    )
+    weatherbitapi.use_handoff(handoff)
+
+
+@callback
+def _async_create_alerts_coordinator(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    weatherbitapi: WeatherBitApi,
+    store: WeatherBitDataStore,
+    update_interval: timedelta,
+    daily_budget: int,
+) -> WeatherBitAlertsCoordinator:
+    """Create the coordinator of the weather alerts and start its first refresh.
+
+    The alerts are not needed to set up the entities, so like the forecasts
+    they are fetched in the background.
+    """
+
+    async def async_update_alerts():
+        """Obtain the latest weather alerts from WeatherFlow."""
+        if alerts_coordinator.data is None and (
+            data := _async_get_stored_data(
+                store, COORDINATOR_ALERTS, alerts_coordinator, weatherbitapi
+            )
+        ):
+            return data
+        try:
+            data: WeatherBitAlerts = await weatherbitapi.update_alerts(
+                max_age=alerts_coordinator.update_interval
+            )
+        except (ResultError, RequestError) as err:
+            raise UpdateFailed(f"Error while retreiving data: {err}") from err
+
+        _async_set_stored_data(store, COORDINATOR_ALERTS, data, weatherbitapi)
+        return data
+
+    alerts_coordinator = WeatherBitAlertsCoordinator(
+        hass,
+        _LOGGER,
+        name=DOMAIN,
+        update_method=async_update_alerts,
+        update_interval=update_interval,
+        stats=weatherbitapi.stats,
+        known=store.async_get_last(COORDINATOR_ALERTS),
+    )
+    entry.async_on_unload(
+        weatherbitapi.key_client.scheduler.async_register(
+            entry.entry_id,
+            COORDINATOR_ALERTS,
+            alerts_coordinator,
+            update_interval,
+            daily_budget,
+        )
+    )
+    entry.async_create_background_task(
+        hass,
+        alerts_coordinator.async_refresh(),
+        f"{DOMAIN} alerts first refresh {entry.title}",
+    )
+    return alerts_coordinator
+
+
+async def _async_refresh_station(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    weatherbitapi: WeatherBitApi,
+    store: WeatherBitDataStore,
+    _now: datetime | None = None,
+) -> None:
+    """Refresh the station data in the background and save it if it changed."""
+    try:
+        await weatherbitapi.initialize()
+    except (InvalidApiKey, ResultError, RequestError) as err:
+        _LOGGER.debug("Could not refresh station data: %s", err)
+        return
+
+    store.async_set_station(weatherbitapi.station_data, weatherbitapi.is_night)
+    station = asdict(weatherbitapi.station_data)
+    if station != entry.data.get(CONF_STATION):
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_STATION: station}
+        )
+
+
+@callback
+def _async_get_stored_data(
+    store: WeatherBitDataStore,
+    kind: str,
+    coordinator: WeatherBitDataUpdateCoordinator,
+    weatherbitapi: WeatherBitApi,
+):
+    """Return stored data fetched within the update interval.
+
+    Only data fetched in the units and language the location uses now is
+    returned. The next refresh is moved forward so it happens one interval
+    after the stored data was fetched.
+    """
+    data = store.async_get(
+        kind, coordinator.update_interval, weatherbitapi.units, weatherbitapi.language
+    )
+    if coordinator.stats is not None:
+        coordinator.stats.async_record_cache(data is not None)
+    if data is None:
+        return None
+    _LOGGER.debug("Using stored %s data for %s", kind, coordinator.name)
+    coordinator.update_interval -= store.async_get_age(kind)
+    return data
+
+
+@callback
+def _async_track_calls(
+    entry: ConfigEntry, weatherbitapi: WeatherBitApi, store: WeatherBitDataStore
+) -> None:
+    """Restore the calls made today and store every call counted from now on."""
+    stats = weatherbitapi.stats
+    stats.async_restore_calls(*store.async_get_calls())
+    entry.async_on_unload(
+        stats.async_add_listener(lambda: store.async_set_calls(stats.calls_today))
+    )
+
+
+@callback
+def _async_set_stored_data(
+    store: WeatherBitDataStore, kind: str, data: Any, weatherbitapi: WeatherBitApi
+) -> None:
+    """Store data just fetched with the units and language it was fetched in."""
+    store.async_set(kind, data, weatherbitapi.units, weatherbitapi.language)
+
+
 async def _async_get_or_create_nvr_device_in_registry(
     hass: HomeAssistant, entry: ConfigEntry, station_data: BaseDataDescription
 ) -> None:
@@ -186,8 +569,63 @@ async def _async_get_or_create_nvr_device_in_registry(
 
 
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry):
-    """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Update options.
+
+    Intervals, budget and language are applied to the running entry, so the
+    entities and the data stay in place and no calls are spent. Other options
+    change the entities or coordinators, and reload the entry.
+    """
+    entry_data: WeatherBitEntryData = hass.data[DOMAIN][entry.entry_id]
+    changed = {
+        key
+        for key in entry.options.keys() | entry_data.options.keys()
+        if entry.options.get(key) != entry_data.options.get(key)
+    }
+    if not changed:
+        # The entry data was updated, like by the station refresh.
+        return
+    if not changed <= LIVE_OPTIONS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    entry_data.options = dict(entry.options)
+    weatherbitapi = entry_data.weatherbitapi
+    weatherbitapi.key_client.scheduler.async_update_entry(
+        entry.entry_id,
+        _async_get_min_intervals(entry),
+        entry.options.get(CONF_DAILY_CALL_BUDGET, DEFAULT_DAILY_CALL_BUDGET),
+    )
+    if CONF_FORECAST_LANGUAGE in changed:
+        # The observation follows at its next update.
+        weatherbitapi.language = entry.options[CONF_FORECAST_LANGUAGE]
+        await entry_data.forecast_coordinator.async_refresh()
+    if CONF_ALERT_DESCRIPTIONS in changed and entry_data.alerts_coordinator:
+        entry_data.alerts_coordinator.async_update_listeners()
+
+
+@callback
+def _async_get_min_intervals(entry: ConfigEntry) -> dict[str, timedelta]:
+    """Return the shortest update interval of each kind of coordinator."""
+    sensor_interval = timedelta(
+        minutes=entry.options.get(CONF_INTERVAL_SENSORS, DEFAULT_INTERVAL_SENSORS)
+    )
+    forecast_interval = timedelta(
+        minutes=entry.options.get(CONF_INTERVAL_FORECAST, DEFAULT_INTERVAL_FORECAST)
+    )
+    return {
+        COORDINATOR_SENSORS: ADAPTIVE_MIN_INTERVAL
+        if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+        else sensor_interval,
+        COORDINATOR_FORECAST: forecast_interval,
+        COORDINATOR_HOURLY: forecast_interval,
+        COORDINATOR_ALERTS: sensor_interval,
+    }
+
+
+def _get_pool_keys(entry: ConfigEntry) -> list[str]:
+    """Return the extra API keys of an entry, given separated by commas or spaces."""
+    value = entry.options.get(CONF_API_KEY_POOL, DEFAULT_API_KEY_POOL)
+    return value.replace(",", " ").split()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -195,5 +633,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(
         entry, WEATHERBIT_PLATFORMS
     )
+    if unload_ok:
+        entry_data: WeatherBitEntryData = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data.store.async_flush()
     return unload_ok
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a deleted WeatherFlow entry."""
+    await WeatherBitDataStore(hass, entry.entry_id).async_remove()
+
@@ -0,0 +1,136 @@
+"""Adaptive polling for the Weatherbit integration."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import callback
+import homeassistant.util.dt as dt_util
+from pyweatherbitdata.data import ObservationDescription
+from pyweatherbitdata.helpers import Conversions
+
+from .const import (
+    ADAPTIVE_HISTORY,
+    ADAPTIVE_MAX_WEIGHT,
+    ADAPTIVE_MIN_WEIGHT,
+    ADAPTIVE_WINDOW,
+)
+
+# Change per hour, or precipitation rate, that counts as fully active weather,
+# in metric units, and the conversion to the units of the observation.
+_ACTIVE_RATES: dict[str, tuple[float, str]] = {
+    "temp": (1.0, "temperature"),
+    "slp": (1.0, "pressure"),
+    "wind_spd": (2.0, "windspeed"),
+}
+_ACTIVE_PRECIP = (1.0, "rain")
+
+
+@dataclass(frozen=True)
+class _Sample:
+    """The observed values used to measure change."""
+
+    time: datetime
+    temp: float | None
+    slp: float | None
+    wind_spd: float | None
+    precip: float | None
+
+
+class WeatherBitActivityTracker:
+    """Measure how fast the weather changes and turn it into a polling weight.
+
+    The weight tells the call scheduler how large a part of the daily budget
+    the observation coordinator should get compared to the other coordinators.
+    Calm weather gives a weight below 1, so calls are saved, and a passing
+    front or rain gives a weight above 1, so the observation is polled more
+    often. The observation is in the units of Home Assistant, so the
+    thresholds are converted to those units the same way.
+    """
+
+    def __init__(self, cnv: Conversions) -> None:
+        """Initialize the tracker."""
+        self._active_rates = {
+            field: _convert_change(cnv, conversion, rate)
+            for field, (rate, conversion) in _ACTIVE_RATES.items()
+        }
+        self._active_precip = _convert_change(cnv, _ACTIVE_PRECIP[1], _ACTIVE_PRECIP[0])
+        self._samples: deque[_Sample] = deque(maxlen=ADAPTIVE_HISTORY)
+        self.rates: dict[str, float] = {}
+        self.activity = 0.0
+        self.weight = 1.0
+
+    @callback
+    def async_add_observation(
+        self, observation: ObservationDescription, pop: int | None
+    ) -> float:
+        """Add an observation and return the new weight.
+
+        pop is the probability of precipitation today from the forecast.
+        """
+        time = observation.observation_time
+        if not isinstance(time, datetime):
+            time = dt_util.utcnow()
+        if self._samples and time <= self._samples[-1].time:
+            # The same observation as last time tells nothing new.
+            return self.weight
+
+        self._samples.append(
+            _Sample(
+                time,
+                observation.temp,
+                observation.slp,
+                observation.wind_spd,
+                observation.precip,
+            )
+        )
+        self.rates = self._rates()
+        if not self.rates:
+            # Change can only be measured from the second observation on.
+            return self.weight
+
+        scores = [
+            rate / self._active_rates[field] for field, rate in self.rates.items()
+        ]
+        if observation.precip:
+            scores.append(observation.precip / self._active_precip)
+        self.activity = max(scores, default=0.0) + (pop or 0) / 200
+        self.weight = min(ADAPTIVE_MIN_WEIGHT + self.activity, ADAPTIVE_MAX_WEIGHT)
+        return self.weight
+
+    def _rates(self) -> dict[str, float]:
+        """Return the change per hour over the last ADAPTIVE_WINDOW."""
+        newest = self._samples[-1]
+        window = [
+            sample
+            for sample in self._samples
+            if newest.time - sample.time <= ADAPTIVE_WINDOW
+        ]
+        oldest = window[0]
+        hours = (newest.time - oldest.time) / timedelta(hours=1)
+        if hours <= 0:
+            return {}
+
+        rates: dict[str, float] = {}
+        for field in _ACTIVE_RATES:
+            old, new = getattr(oldest, field), getattr(newest, field)
+            if old is not None and new is not None:
+                rates[field] = round(abs(new - old) / hours, 3)
+        return rates
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the tracker for diagnostics."""
+        return {
+            "samples": len(self._samples),
+            "rates": self.rates,
+            "activity": round(self.activity, 3),
+            "weight": round(self.weight, 3),
+        }
+
+
+def _convert_change(cnv: Conversions, conversion: str, change: float) -> float:
+    """Return a metric change in the units of the observation."""
+    convert = getattr(cnv, conversion)
+    return convert(change) - convert(0.0)
@@ -0,0 +1,207 @@
+"""Severe weather alerts for the Weatherbit integration."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import re
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    ATTR_ALERT_DESCRIPTION_EN,
+    ATTR_ALERT_DESCRIPTION_LOC,
+    ATTR_ALERT_EFFECTIVE,
+    ATTR_ALERT_ENDS,
+    ATTR_ALERT_EXPIRES,
+    ATTR_ALERT_ONSET,
+    ATTR_ALERT_REGIONS,
+    ATTR_ALERT_SEVERITY,
+    ATTR_ALERT_TITLE,
+    ATTR_ALERT_URI,
+)
+
+# Icon and colour of the alert markdown for each severity.
+_SEVERITY_STYLES = {
+    "Advisory": ("shield-alert", "gold"),
+    "Watch": ("alert-circle", "darkorange"),
+    "Warning": ("alert", "firebrick"),
+}
+
+# European alerts hold one paragraph per language, like "English (en-GB): ...".
+_LANGUAGE_LABEL = re.compile(r"^[^\n:]+ \((?P<language>[a-z]{2})(?:-\w+)?\): ", re.M)
+
+
+@dataclass(frozen=True)
+class WeatherBitAlert:
+    """One severe weather alert, identified by its uri."""
+
+    uri: str
+    title: str | None = None
+    severity: str | None = None
+    effective: str | None = None
+    onset: str | None = None
+    ends: str | None = None
+    expires: str | None = None
+    regions: tuple[str, ...] = ()
+    description_en: str | None = None
+    description_local: str | None = None
+
+    @classmethod
+    def from_response(cls, item: dict[str, Any], language: str) -> WeatherBitAlert:
+        """Build an alert from an item of the alerts response."""
+        description_en, description_local = _split_description(
+            item.get("description"), language
+        )
+        return cls(
+            uri=item["uri"],
+            title=item.get("title"),
+            severity=item.get("severity"),
+            effective=_utc_time(item.get("effective_utc")),
+            onset=_utc_time(item.get("onset_utc")),
+            ends=_utc_time(item.get("ends_utc")),
+            expires=_utc_time(item.get("expires_utc")),
+            regions=tuple(item.get("regions") or ()),
+            description_en=description_en,
+            description_local=description_local,
+        )
+
+    def as_attributes(self, descriptions: bool = False) -> dict[str, Any]:
+        """Return the alert as state attributes, with the texts if asked for."""
+        attributes = {
+            ATTR_ALERT_TITLE: self.title,
+            ATTR_ALERT_SEVERITY: self.severity,
+            ATTR_ALERT_EFFECTIVE: self.effective,
+            ATTR_ALERT_ONSET: self.onset,
+            ATTR_ALERT_ENDS: self.ends,
+            ATTR_ALERT_EXPIRES: self.expires,
+            ATTR_ALERT_URI: self.uri,
+            ATTR_ALERT_REGIONS: list(self.regions),
+        }
+        if descriptions:
+            attributes[ATTR_ALERT_DESCRIPTION_EN] = self.description_en
+            attributes[ATTR_ALERT_DESCRIPTION_LOC] = self.description_local
+        return attributes
+
+
+@dataclass(frozen=True)
+class WeatherBitAlerts:
+    """The alerts in force at a location, keyed by uri."""
+
+    city_name: str | None = None
+    alerts: dict[str, WeatherBitAlert] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of alerts."""
+        return len(self.alerts)
+
+    @classmethod
+    def from_response(
+        cls, response: dict[str, Any], language: str
+    ) -> WeatherBitAlerts:
+        """Build the alerts from the response of the alerts endpoint."""
+        alerts: dict[str, WeatherBitAlert] = {}
+        for item in response["alerts"] or ():
+            alert = WeatherBitAlert.from_response(item, language)
+            alerts[alert.uri] = alert
+        return cls(city_name=response.get("city_name"), alerts=alerts)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeatherBitAlerts:
+        """Rebuild the alerts from their stored form."""
+        return cls(
+            city_name=data["city_name"],
+            alerts={
+                uri: WeatherBitAlert(**{**alert, "regions": tuple(alert["regions"])})
+                for uri, alert in data["alerts"].items()
+            },
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the alerts in a form that can be stored."""
+        return asdict(self)
+
+    def diff(
+        self, previous: WeatherBitAlerts | None
+    ) -> tuple[list[WeatherBitAlert], list[WeatherBitAlert]]:
+        """Return the alerts that are new and those gone since previous."""
+        known = previous.alerts if previous is not None else {}
+        new = [alert for uri, alert in self.alerts.items() if uri not in known]
+        expired = [alert for uri, alert in known.items() if uri not in self.alerts]
+        return new, expired
+
+    def as_markdown(self) -> str:
+        """Render the alerts as markdown for a dashboard card.
+
+        Times are shown in the local time of Home Assistant, so the markdown
+        is rendered again when the alerts change, not when it is shown.
+        """
+        blocks = []
+        for alert in self.alerts.values():
+            icon, colour = _SEVERITY_STYLES.get(
+                alert.severity or "", _SEVERITY_STYLES["Warning"]
+            )
+            blocks.append(
+                "\n".join(
+                    (
+                        "---",
+                        "| | |",
+                        "| --- | --- |",
+                        f"| <font color='{colour}'><ha-icon icon='mdi:{icon}'>"
+                        f"</ha-icon></font> | **{alert.title or alert.severity}**"
+                        f"<br>From: {_local_time(alert.effective)}"
+                        f"<br>To: {_local_time(alert.expires)}"
+                        f"<br>More info: {alert.uri} |",
+                        "",
+                        alert.description_local or "",
+                    )
+                ).rstrip()
+            )
+        return "\n\n".join(blocks)
+
+
+def _utc_time(value: str | None) -> str | None:
+    """Return a UTC time of the response, like 2023-11-14T21:00:00, with zone."""
+    if not value:
+        return None
+    try:
+        time = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=dt_util.UTC)
+    return time.isoformat()
+
+
+def _local_time(value: str | None) -> str:
+    """Return a UTC time of an alert as a short local time."""
+    if value is None or (time := dt_util.parse_datetime(value)) is None:
+        return "-"
+    return dt_util.as_local(time).strftime("%d %b %H:%M")
+
+
+def _split_description(
+    text: str | None, language: str
+) -> tuple[str | None, str | None]:
+    """Return the English and the local description of an alert.
+
+    Texts without language labels, like those of US alerts, are used as is
+    for both.
+    """
+    if not text:
+        return None, None
+    labels = list(_LANGUAGE_LABEL.finditer(text))
+    if not labels:
+        text = text.strip()
+        return text, text
+
+    parts: dict[str, str] = {}
+    for label, following in zip(labels, [*labels[1:], None]):
+        end = following.start() if following is not None else len(text)
+        parts.setdefault(label["language"], text[label.end() : end].strip())
+    description_en = parts.get("en", next(iter(parts.values())))
+    # The local text is the one in the forecast language, or else the one in
+    # the language of the location.
+    local = {code: part for code, part in parts.items() if code != "en"}
+    description_local = local.get(language, next(iter(local.values()), description_en))
+    return description_en, description_local
@@ -0,0 +1,527 @@
+"""Shared API clients for the Weatherbit integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+from http import HTTPStatus
+from typing import Any, TypeVar
+
+from aiohttp import ClientError, ClientResponseError, ClientSession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+from homeassistant.helpers.storage import Store
+from homeassistant.util.location import distance
+from pyweatherbitdata import (
+    InvalidApiKey,
+    NotInitialized,
+    RequestError,
+    ResultError,
+    WeatherBitApiClient,
+)
+from pyweatherbitdata.const import BASE_URL
+from pyweatherbitdata.data import (
+    BaseDataDescription,
+    ForecastDescription,
+    ObservationDescription,
+)
+
+from .const import (
+    DATA_CLIENTS,
+    DEFAULT_HOURLY_FORECAST_HOURS,
+    DOMAIN,
+    HANDOFF_MAX_AGE,
+    MAX_LOCATION_DECIMALS,
+    MAX_PARALLEL_REQUESTS,
+    STORAGE_VERSION,
+)
+from .alerts import WeatherBitAlerts
+from .forecast import WeatherBitHourlyForecast
+from .pool import RateLimitExceeded, WeatherBitKeyPool, key_digest
+from .scheduler import WeatherBitCallScheduler
+from .stats import WeatherBitApiStats
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class WeatherBitKeyClient:
+    """Connection resources shared by all entries using the same API key."""
+
+    api_key: str
+    session: ClientSession
+    limiter: asyncio.Semaphore
+    pool: WeatherBitKeyPool
+    scheduler: WeatherBitCallScheduler
+    entry_ids: set[str] = field(default_factory=set)
+    in_flight: dict[tuple[Any, ...], asyncio.Task[Any]] = field(default_factory=dict)
+    shared_locations: dict[str, WeatherBitSharedLocation] = field(
+        default_factory=dict
+    )
+    shared_results: dict[tuple[Any, ...], tuple[float, str, Any]] = field(
+        default_factory=dict
+    )
+
+
+@dataclass(frozen=True)
+class WeatherBitSharedLocation:
+    """A location sharing its data with the locations near it."""
+
+    latitude: float
+    longitude: float
+    station: str
+    radius: float
+    share_key: tuple[float, float]
+
+
+@dataclass
+class WeatherBitHandoff:
+    """What the config flow learned about a location, for the setup of its entry."""
+
+    is_night: bool
+    responses: dict[str, dict[str, Any]]
+    created: float = field(default_factory=time.monotonic)
+
+
+class WeatherBitUrlClient(WeatherBitApiClient):
+    """WeatherBit API client that can send its requests to another server.
+
+    The library builds every endpoint from the public API address. When a
+    base URL is given, that address is replaced, so a local stand-in for the
+    API can be used while developing. Requests are made here rather than by
+    the library, which drops the HTTP status of an error, so that a key over
+    its quota can be told from other failures.
+    """
+
+    def __init__(
+        self, *args: Any, base_url: str | None = None, **kwargs: Any
+    ) -> None:
+        """Initialize the client."""
+        super().__init__(*args, **kwargs)
+        self.base_url = base_url.rstrip("/") if base_url else None
+
+    async def _async_request(self, method: str, endpoint: str) -> dict[str, Any]:
+        """Make a request against the configured server."""
+        if self.base_url is not None and endpoint.startswith(BASE_URL):
+            endpoint = f"{self.base_url}{endpoint[len(BASE_URL):]}"
+        if self.req is None or self.req.closed:
+            return await super()._async_request(method, endpoint)
+
+        try:
+            async with self.req.request(method, endpoint) as resp:
+                resp.raise_for_status()
+                return await resp.json()
+        except ClientResponseError as err:
+            if err.status == HTTPStatus.FORBIDDEN:
+                raise InvalidApiKey(
+                    "The API Key used is not valid. Try again with a new key."
+                ) from None
+            if err.status == HTTPStatus.TOO_MANY_REQUESTS:
+                raise RateLimitExceeded(
+                    f"Error requesting data from WeatherBit: {err}"
+                ) from None
+            raise RequestError(f"Error requesting data from WeatherBit: {err}") from None
+        except ClientError as err:
+            raise RequestError(f"Error requesting data from WeatherBit: {err}") from None
+
+
+class WeatherBitFlowClient(WeatherBitUrlClient):
+    """WeatherBit API client of the config flow, keeping the responses it got."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client."""
+        super().__init__(*args, **kwargs)
+        self.responses: dict[str, dict[str, Any]] = {}
+
+    async def _async_request(self, method: str, endpoint: str) -> dict[str, Any]:
+        """Make a request and keep the response by endpoint."""
+        data = await super()._async_request(method, endpoint)
+        self.responses[endpoint] = data
+        return data
+
+    def handoff(self) -> WeatherBitHandoff:
+        """Return what was learned, to be used when the entry is set up."""
+        return WeatherBitHandoff(self._is_night, dict(self.responses))
+
+
+class WeatherBitApi(WeatherBitUrlClient):
+    """WeatherBit API client for one location, using a shared key client."""
+
+    def __init__(
+        self,
+        key_client: WeatherBitKeyClient,
+        latitude: float,
+        longitude: float,
+        units: str,
+        language: str,
+        base_url: str | None = None,
+    ) -> None:
+        """Initialize the client."""
+        super().__init__(
+            key_client.api_key,
+            latitude,
+            longitude,
+            units=units,
+            language=language,
+            homeassistant=True,
+            session=key_client.session,
+            base_url=base_url,
+        )
+        self.key_client = key_client
+        self.stats = WeatherBitApiStats()
+        self._handoff_responses: dict[str, dict[str, Any]] = {}
+        self.share_key: tuple[float, float] | None = None
+        self._share_entry_id: str | None = None
+
+    @property
+    def is_night(self) -> bool:
+        """Return True if it was night at the location when initialized."""
+        return self._is_night
+
+    def restore_station_data(
+        self, station_data: BaseDataDescription, is_night: bool
+    ) -> None:
+        """Use previously fetched station data instead of calling initialize."""
+        self._station_data = station_data
+        self._is_night = is_night
+
+    def use_handoff(self, handoff: WeatherBitHandoff) -> None:
+        """Answer the first request to each endpoint of the config flow from it.
+
+        The calls were made by the flow, so they are counted against today's
+        quota here.
+        """
+        self._handoff_responses = dict(handoff.responses)
+        for _endpoint in handoff.responses:
+            self.key_client.scheduler.async_record_call(self.api_key)
+
+    @callback
+    def async_share_nearby(self, entry_id: str, radius: float) -> CALLBACK_TYPE:
+        """Share data with locations of the same key within radius metres.
+
+        Locations on the same station share data too. Shared locations use the
+        location of the first one as their key, and a result one of them
+        fetched is used by the others while it is younger than half their
+        update interval. Returns a callback that stops sharing.
+        """
+        shared_locations = self.key_client.shared_locations
+        share_key = next(
+            (
+                location.share_key
+                for location in shared_locations.values()
+                if location.station == self.station_data.key
+                or distance(
+                    self.latitude,
+                    self.longitude,
+                    location.latitude,
+                    location.longitude,
+                )
+                <= min(radius, location.radius)
+            ),
+            self._location_key(),
+        )
+        shared_locations[entry_id] = WeatherBitSharedLocation(
+            self.latitude, self.longitude, self.station_data.key, radius, share_key
+        )
+        self.share_key = share_key
+        self._share_entry_id = entry_id
+
+        @callback
+        def _async_stop_sharing() -> None:
+            shared_locations.pop(entry_id, None)
+            self.share_key = None
+            self._share_entry_id = None
+
+        return _async_stop_sharing
+
+    async def update_sensors(
+        self, max_age: timedelta | None = None
+    ) -> ObservationDescription:
+        """Return the current observation."""
+        return await self._async_single_flight(
+            "current", super().update_sensors, max_age=max_age
+        )
+
+    async def update_forecast(
+        self, max_age: timedelta | None = None
+    ) -> ForecastDescription:
+        """Return the daily forecast."""
+        return await self._async_single_flight(
+            "forecast/daily", super().update_forecast, max_age=max_age
+        )
+
+    async def update_hourly_forecast(
+        self,
+        hours: int = DEFAULT_HOURLY_FORECAST_HOURS,
+        max_age: timedelta | None = None,
+    ) -> WeatherBitHourlyForecast:
+        """Return the hourly forecast for the next hours."""
+        return await self._async_single_flight(
+            "forecast/hourly",
+            lambda: self._async_fetch_hourly_forecast(hours),
+            hours,
+            max_age=max_age,
+        )
+
+    async def update_alerts(
+        self, max_age: timedelta | None = None
+    ) -> WeatherBitAlerts:
+        """Return the severe weather alerts in force at the location."""
+        return await self._async_single_flight(
+            "alerts", self._async_fetch_alerts, max_age=max_age
+        )
+
+    async def _async_single_flight(
+        self,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[_T]],
+        *args: Any,
+        max_age: timedelta | None = None,
+    ) -> _T:
+        """Share one request between all callers asking for the same data.
+
+        Updates of entries for the same location, or a manual update during a
+        scheduled one, would otherwise each make a call for the same data.
+        The request runs as a task of its own, so a caller that is cancelled
+        does not cancel it for the others. A location sharing data with the
+        locations near it also uses a result another of them fetched within
+        half of max_age. Its own results are never handed back to it, and the
+        margin keeps a poll that comes a little early from being skipped.
+        """
+        key = (
+            endpoint,
+            *(self.share_key or self._location_key()),
+            self.language,
+            self.units,
+            *args,
+        )
+        key_client = self.key_client
+        if (
+            self._share_entry_id is not None
+            and max_age is not None
+            and (shared := key_client.shared_results.get(key)) is not None
+            and shared[1] != self._share_entry_id
+            and time.monotonic() - shared[0] < max_age.total_seconds() / 2
+        ):
+            self.stats.async_record_shared()
+            return shared[2]
+
+        if (task := key_client.in_flight.get(key)) is None:
+            task = key_client.in_flight[key] = asyncio.create_task(fetch())
+            task.add_done_callback(
+                partial(_async_request_done, key_client, key, self._share_entry_id)
+            )
+        else:
+            self.stats.async_record_shared()
+        return await asyncio.shield(task)
+
+    def _location_key(self) -> tuple[float, float]:
+        """Return the location, rounded so it can be compared."""
+        return (
+            round(self.latitude, MAX_LOCATION_DECIMALS),
+            round(self.longitude, MAX_LOCATION_DECIMALS),
+        )
+
+    async def _async_fetch_hourly_forecast(
+        self, hours: int
+    ) -> WeatherBitHourlyForecast:
+        """Fetch the hourly forecast for the next hours.
+
+        The hourly endpoint is not part of the Free Tier.
+        """
+        if self.station_data is None:
+            raise NotInitialized("Station Data have not been initialized.")
+
+        endpoint = (
+            f"{BASE_URL}/forecast/hourly?lat={self.latitude}&lon={self.longitude}"
+            f"&key={self.api_key}&lang={self.language}&units=M&hours={hours}"
+        )
+        data = await self._async_request("get", endpoint)
+
+        try:
+            return WeatherBitHourlyForecast.from_response(data, self.cnv)
+        except (KeyError, TypeError, ValueError, AttributeError) as err:
+            raise ResultError(
+                "Data returned from WeatherBit. But empty or in unexpected format."
+            ) from err
+
+    async def _async_fetch_alerts(self) -> WeatherBitAlerts:
+        """Fetch the severe weather alerts in force at the location.
+
+        Every fetch of the alerts counts as a call against the daily quota.
+        """
+        if self.station_data is None:
+            raise NotInitialized("Station Data have not been initialized.")
+
+        endpoint = (
+            f"{BASE_URL}/alerts?lat={self.latitude}&lon={self.longitude}"
+            f"&key={self.api_key}"
+        )
+        data = await self._async_request("get", endpoint)
+
+        try:
+            return WeatherBitAlerts.from_response(data, self.language)
+        except (KeyError, TypeError, ValueError, AttributeError) as err:
+            raise ResultError(
+                "Data returned from WeatherBit. But empty or in unexpected format."
+            ) from err
+
+    async def _async_request(self, method: str, endpoint: str) -> dict[str, Any]:
+        """Make a request, limiting the number of parallel requests per key.
+
+        The request is made with the key of the pool with the most calls left,
+        and made again with another key if the API rejects that one.
+        """
+        if (data := self._handoff_responses.pop(endpoint, None)) is not None:
+            return data
+        key_client = self.key_client
+        async with key_client.limiter:
+            while True:
+                api_key = key_client.pool.async_pick()
+                key_client.scheduler.async_record_call(api_key)
+                start = time.monotonic()
+                try:
+                    return await super()._async_request(
+                        method,
+                        endpoint.replace(f"key={self.api_key}", f"key={api_key}", 1),
+                    )
+                except (InvalidApiKey, RequestError) as err:
+                    if not key_client.pool.async_fail_over(api_key, err):
+                        raise
+                    key_client.scheduler.async_rebalance()
+                finally:
+                    self.stats.async_record_request(
+                        _endpoint_name(endpoint), time.monotonic() - start
+                    )
+
+
+@callback
+def _async_request_done(
+    key_client: WeatherBitKeyClient,
+    key: tuple[Any, ...],
+    fetched_by: str | None,
+    task: asyncio.Task[Any],
+) -> None:
+    """Forget a finished request, keeping its result for shared locations.
+
+    fetched_by is the entry that made the request, if it shares its data.
+    """
+    key_client.in_flight.pop(key, None)
+    if fetched_by is not None and not task.cancelled() and task.exception() is None:
+        key_client.shared_results[key] = (time.monotonic(), fetched_by, task.result())
+
+
+def _expired(handoff: WeatherBitHandoff) -> bool:
+    """Return True if a handoff is too old to be used."""
+    return time.monotonic() - handoff.created > HANDOFF_MAX_AGE.total_seconds()
+
+
+def _endpoint_name(endpoint: str) -> str:
+    """Return the API path of an endpoint URL, like forecast/daily."""
+    return endpoint.removeprefix(BASE_URL).split("?", 1)[0].strip("/")
+
+
+class WeatherBitClientRegistry:
+    """Hand out one session, request limiter and call scheduler per API key."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self._clients: dict[str, WeatherBitKeyClient] = {}
+        self._handoffs: dict[str, WeatherBitHandoff] = {}
+        # Kept after a key client is closed, so a client created again for the
+        # key loads the calls its predecessor has not written yet.
+        self._call_stores: dict[str, Store[dict[str, Any]]] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close_all)
+
+    @callback
+    def async_acquire(
+        self, api_key: str, entry_id: str, pool_keys: Iterable[str] = ()
+    ) -> WeatherBitKeyClient:
+        """Return the key client for an API key and register the entry as a user.
+
+        The extra keys of the entry are added to the pool of the key client.
+        The calls made today are restored by WeatherBitCallScheduler.async_load.
+        """
+        if (key_client := self._clients.get(api_key)) is None:
+            _LOGGER.debug("Creating shared session for API key ending in %s", api_key[-4:])
+            pool = WeatherBitKeyPool(api_key)
+            if (store := self._call_stores.get(api_key)) is None:
+                store = self._call_stores[api_key] = Store(
+                    self.hass, STORAGE_VERSION, f"{DOMAIN}.calls.{key_digest(api_key)}"
+                )
+            key_client = WeatherBitKeyClient(
+                api_key=api_key,
+                session=async_create_clientsession(self.hass, auto_cleanup=False),
+                limiter=asyncio.Semaphore(MAX_PARALLEL_REQUESTS),
+                pool=pool,
+                scheduler=WeatherBitCallScheduler(self.hass, pool, store),
+            )
+            self._clients[api_key] = key_client
+        key_client.entry_ids.add(entry_id)
+        key_client.pool.async_add(entry_id, pool_keys)
+        return key_client
+
+    @callback
+    def async_release(self, api_key: str, entry_id: str) -> None:
+        """Unregister an entry, closing the session when the last user is gone."""
+        if (key_client := self._clients.get(api_key)) is None:
+            return
+        key_client.entry_ids.discard(entry_id)
+        key_client.pool.async_remove(entry_id)
+        if key_client.entry_ids:
+            return
+        _LOGGER.debug("Closing shared session for API key ending in %s", api_key[-4:])
+        del self._clients[api_key]
+        key_client.scheduler.async_shutdown()
+        key_client.session.detach()
+
+    @callback
+    def async_get_session(self, api_key: str) -> ClientSession:
+        """Return a session for a one-off request without registering a user."""
+        if (key_client := self._clients.get(api_key)) is not None:
+            return key_client.session
+        return async_get_clientsession(self.hass)
+
+    @callback
+    def async_set_handoff(self, unique_id: str, handoff: WeatherBitHandoff) -> None:
+        """Keep the result of a config flow for the setup of the new entry."""
+        self._handoffs = {
+            key: item for key, item in self._handoffs.items() if not _expired(item)
+        }
+        self._handoffs[unique_id] = handoff
+
+    @callback
+    def async_pop_handoff(self, unique_id: str | None) -> WeatherBitHandoff | None:
+        """Return the result of the config flow that created an entry, if recent."""
+        handoff = self._handoffs.pop(unique_id, None)
+        if handoff is None or _expired(handoff):
+            return None
+        return handoff
+
+    @callback
+    def _async_close_all(self, _event: Event) -> None:
+        """Close all sessions when Home Assistant shuts down."""
+        for key_client in self._clients.values():
+            key_client.scheduler.async_shutdown()
+            key_client.session.detach()
+        self._clients.clear()
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> WeatherBitClientRegistry:
+    """Return the client registry, creating it on first use."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (registry := domain_data.get(DATA_CLIENTS)) is None:
+        registry = domain_data[DATA_CLIENTS] = WeatherBitClientRegistry(hass)
+    return registry
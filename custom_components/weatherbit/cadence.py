@@ -0,0 +1,91 @@
+"""Observation publish cadence for the Weatherbit integration."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+from math import ceil, gcd
+from typing import Any
+
+from homeassistant.core import callback
+from pyweatherbitdata.data import ObservationDescription
+
+from .const import CADENCE_HISTORY, CADENCE_MARGIN, CADENCE_MIN_PERIOD
+
+
+class WeatherBitPublishCadence:
+    """Learn when new observations are published and when to poll for them.
+
+    The station behind a location publishes observations at a steady cadence,
+    and Weatherbit makes them available some time later. A poll between two
+    publishes returns the observation already known, so the next poll is
+    moved to just after the next expected publish.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cadence."""
+        self._times: deque[datetime] = deque(maxlen=CADENCE_HISTORY)
+        self._delays: deque[timedelta] = deque(maxlen=CADENCE_HISTORY)
+        self.period: timedelta | None = None
+        self.delay: timedelta | None = None
+
+    @callback
+    def async_add_observation(
+        self, observation: ObservationDescription, fetched: datetime
+    ) -> bool:
+        """Add a fetched observation and return if it is a new one."""
+        time = observation.observation_time
+        if not isinstance(time, datetime):
+            return True
+        if self._times and time <= self._times[-1]:
+            return False
+
+        self._times.append(time)
+        # The time from observation to fetch is an upper bound of the publish
+        # delay, so the smallest one seen is the best estimate.
+        self._delays.append(max(fetched - time, timedelta(0)))
+        self.delay = min(self._delays)
+        self.period = self._period()
+        return True
+
+    @callback
+    def async_next_poll(
+        self, now: datetime, interval: timedelta
+    ) -> timedelta | None:
+        """Return the time until the first expected publish after interval.
+
+        The poll is only ever moved later, so the interval set by the call
+        budget, and the configured shortest interval, are always kept. None is
+        returned until the cadence is known.
+        """
+        if self.period is None or self.delay is None:
+            return None
+        earliest = now + interval
+        publish = self._times[-1] + self.delay + CADENCE_MARGIN
+        if publish < earliest:
+            publish += ceil((earliest - publish) / self.period) * self.period
+        return publish - now
+
+    def _period(self) -> timedelta | None:
+        """Return the publish period from the gaps between observations.
+
+        Polls do not see every publish, so each gap is a multiple of the
+        period, and their greatest common divisor is the period itself.
+        """
+        minutes = 0
+        times = list(self._times)
+        for older, newer in zip(times, times[1:]):
+            minutes = gcd(minutes, round((newer - older) / timedelta(minutes=1)))
+        period = timedelta(minutes=minutes)
+        if period < CADENCE_MIN_PERIOD:
+            # No observations yet, or no regular cadence.
+            return None
+        return period
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the cadence for diagnostics."""
+        return {
+            "observations": len(self._times),
+            "period": str(self.period) if self.period else None,
+            "delay": str(self.delay) if self.delay is not None else None,
+            "last_observation": self._times[-1].isoformat() if self._times else None,
+        }
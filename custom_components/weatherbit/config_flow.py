@@ -2,30 +2,54 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict
 
 import voluptuous as vol
 from homeassistant import config_entries
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import CONF_API_KEY, CONF_ID, CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from pyweatherbitdata import (
     RequestError,
     InvalidApiKey,
     ResultError,
-    WeatherBitApiClient,
 )
 from pyweatherbitdata.const import VALID_LANGUAGES
 from pyweatherbitdata.data import BaseDataDescription
+from .api import WeatherBitFlowClient, async_get_registry
 from .const import (
     DOMAIN,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ALERTS,
+    CONF_ALERT_DESCRIPTIONS,
+    CONF_API_KEY_POOL,
+    CONF_BASE_URL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ALERTS,
+    DEFAULT_ALERT_DESCRIPTIONS,
+    DEFAULT_API_KEY_POOL,
+    DEFAULT_DAILY_CALL_BUDGET,
+    DEFAULT_FORECAST_DAYS,
     DEFAULT_FORECAST_LANGUAGE,
+    DEFAULT_HOURLY_FORECAST,
+    DEFAULT_HOURLY_FORECAST_HOURS,
+    DEFAULT_INTERPOLATION,
     DEFAULT_INTERVAL_FORECAST,
     DEFAULT_INTERVAL_SENSORS,
+    DEFAULT_SHARE_RADIUS,
     CONF_INTERVAL_SENSORS,
     CONF_INTERVAL_FORECAST,
+    CONF_FORECAST_DAYS,
     CONF_FORECAST_LANGUAGE,
+    CONF_DAILY_CALL_BUDGET,
+    CONF_HOURLY_FORECAST,
+    CONF_HOURLY_FORECAST_HOURS,
+    CONF_INTERPOLATION,
+    CONF_SHARE_RADIUS,
+    CONF_STATION,
+    MAX_FORECAST_DAYS,
+    MAX_SHARE_RADIUS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,13 +73,16 @@ class WeatherBitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         errors = {}
 
-        session = async_create_clientsession(self.hass)
+        registry = async_get_registry(self.hass)
+        session = registry.async_get_session(user_input[CONF_API_KEY])
 
-        weatherbit = WeatherBitApiClient(
+        base_url = user_input.get(CONF_BASE_URL) or None
+        weatherbit = WeatherBitFlowClient(
             user_input[CONF_API_KEY],
             user_input[CONF_LATITUDE],
             user_input[CONF_LONGITUDE],
             session=session,
+            base_url=base_url,
         )
 
         try:
@@ -77,6 +104,8 @@ class WeatherBitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured()
 
+        # The setup of the entry uses the station and observation fetched here.
+        registry.async_set_handoff(unique_id, weatherbit.handoff())
         return self.async_create_entry(
             title=station_data.city_name,
             data={
@@ -84,6 +113,8 @@ class WeatherBitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_API_KEY: user_input[CONF_API_KEY],
                 CONF_LATITUDE: user_input[CONF_LATITUDE],
                 CONF_LONGITUDE: user_input[CONF_LONGITUDE],
+                CONF_STATION: asdict(station_data),
+                **({CONF_BASE_URL: base_url} if base_url else {}),
             },
             options={
                 CONF_INTERVAL_SENSORS: DEFAULT_INTERVAL_SENSORS,
@@ -94,19 +125,21 @@ class WeatherBitFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _show_setup_form(self, errors=None):
         """Show the setup form to the user."""
+        schema = {
+            vol.Required(CONF_API_KEY): str,
+            vol.Required(
+                CONF_LATITUDE, default=self.hass.config.latitude
+            ): cv.latitude,
+            vol.Required(
+                CONF_LONGITUDE, default=self.hass.config.longitude
+            ): cv.longitude,
+        }
+        if self.show_advanced_options:
+            schema[vol.Optional(CONF_BASE_URL)] = cv.url
+
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_API_KEY): str,
-                    vol.Required(
-                        CONF_LATITUDE, default=self.hass.config.latitude
-                    ): cv.latitude,
-                    vol.Required(
-                        CONF_LONGITUDE, default=self.hass.config.longitude
-                    ): cv.longitude,
-                }
-            ),
+            data_schema=vol.Schema(schema),
             errors=errors or {},
         )
 
@@ -145,6 +178,66 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_FORECAST_LANGUAGE, DEFAULT_FORECAST_LANGUAGE
                         ),
                     ): vol.In(VALID_LANGUAGES),
+                    vol.Optional(
+                        CONF_FORECAST_DAYS,
+                        default=self.config_entry.options.get(
+                            CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_FORECAST_DAYS)),
+                    vol.Optional(
+                        CONF_DAILY_CALL_BUDGET,
+                        default=self.config_entry.options.get(
+                            CONF_DAILY_CALL_BUDGET, DEFAULT_DAILY_CALL_BUDGET
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HOURLY_FORECAST,
+                        default=self.config_entry.options.get(
+                            CONF_HOURLY_FORECAST, DEFAULT_HOURLY_FORECAST
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HOURLY_FORECAST_HOURS,
+                        default=self.config_entry.options.get(
+                            CONF_HOURLY_FORECAST_HOURS, DEFAULT_HOURLY_FORECAST_HOURS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=48, max=240)),
+                    vol.Optional(
+                        CONF_INTERPOLATION,
+                        default=self.config_entry.options.get(
+                            CONF_INTERPOLATION, DEFAULT_INTERPOLATION
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SHARE_RADIUS,
+                        default=self.config_entry.options.get(
+                            CONF_SHARE_RADIUS, DEFAULT_SHARE_RADIUS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_SHARE_RADIUS)),
+                    vol.Optional(
+                        CONF_API_KEY_POOL,
+                        default=self.config_entry.options.get(
+                            CONF_API_KEY_POOL, DEFAULT_API_KEY_POOL
+                        ),
+                    ): str,
+                    vol.Optional(
+                        CONF_ALERTS,
+                        default=self.config_entry.options.get(
+                            CONF_ALERTS, DEFAULT_ALERTS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_ALERT_DESCRIPTIONS,
+                        default=self.config_entry.options.get(
+                            CONF_ALERT_DESCRIPTIONS, DEFAULT_ALERT_DESCRIPTIONS
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -1,7 +1,15 @@
 """Constants in weatherbit component."""
+from datetime import timedelta
+
+ADAPTIVE_HISTORY = 12
+ADAPTIVE_MAX_WEIGHT = 3.0
+ADAPTIVE_MIN_INTERVAL = timedelta(minutes=20)
+ADAPTIVE_MIN_WEIGHT = 0.5
+ADAPTIVE_WINDOW = timedelta(hours=3)
 
 ATTR_ALERTS = "alerts"
 ATTR_ALERTS_CITY_NAME = "city_name"
+ATTR_ALERTS_MARKDOWN = "markdown"
 ATTR_ALERT_DESCRIPTION_EN = "description_english"
 ATTR_ALERT_DESCRIPTION_LOC = "description_local"
 ATTR_ALERT_EFFECTIVE = "effective"
@@ -14,29 +22,98 @@ ATTR_ALERT_TITLE = "title"
 ATTR_ALERT_URI = "uri"
 ATTR_ALT_CONDITION = "alt_condition"
 ATTR_AQI_LEVEL = "aqi_level"
+ATTR_ESTIMATED = "estimated"
+ATTR_OBSERVED_VALUE = "observed_value"
 ATTR_FORECAST_CLOUDINESS = "cloudiness"
 ATTR_FORECAST_SNOW = "snow"
 ATTR_FORECAST_WEATHER_TEXT = "weather_text"
 
+CADENCE_HISTORY = 12
+CADENCE_MARGIN = timedelta(minutes=2)
+CADENCE_MIN_PERIOD = timedelta(minutes=5)
+
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_ALERTS = "alerts"
+CONF_API_KEY_POOL = "api_key_pool"
+CONF_ALERT_DESCRIPTIONS = "alert_descriptions"
+CONF_BASE_URL = "base_url"
+CONF_DAILY_CALL_BUDGET = "daily_call_budget"
+CONF_HOURLY_FORECAST = "hourly_forecast"
+CONF_HOURLY_FORECAST_HOURS = "hourly_forecast_hours"
+CONF_INTERPOLATION = "interpolation"
 CONF_INTERVAL_SENSORS = "update_interval"
 CONF_INTERVAL_FORECAST = "forecast_interval"
 CONF_FORECAST_LANGUAGE = "forecast_language"
+CONF_FORECAST_DAYS = "forecast_days"
+CONF_SHARE_RADIUS = "share_radius"
+CONF_STATION = "station"
 CONFIG_OPTIONS = [
     CONF_FORECAST_LANGUAGE,
     CONF_INTERVAL_FORECAST,
     CONF_INTERVAL_SENSORS,
 ]
+# Options applied to a running entry. Changing any other option reloads it.
+LIVE_OPTIONS = {
+    CONF_ALERT_DESCRIPTIONS,
+    CONF_DAILY_CALL_BUDGET,
+    CONF_FORECAST_LANGUAGE,
+    CONF_HOURLY_FORECAST_HOURS,
+    CONF_INTERVAL_FORECAST,
+    CONF_INTERVAL_SENSORS,
+}
 CONF_UNIT_SYSTEM_IMPERIAL = "imperial"
 CONF_UNIT_SYSTEM_METRIC = "metric"
 
+CALL_BUDGET_RESERVE = 2
+
+COORDINATOR_ALERTS = "alerts"
+COORDINATOR_FORECAST = "forecast"
+COORDINATOR_HOURLY = "hourly"
+COORDINATOR_SENSORS = "sensors"
+
+DATA_CLIENTS = "clients"
+
+DATA_SOURCE_ALERTS = "alerts"
+DATA_SOURCE_BOTH = "both"
+DATA_SOURCE_FORECAST = "forecast"
+DATA_SOURCE_HOURLY = "hourly"
+DATA_SOURCE_OBSERVATION = "observation"
+
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_ALERTS = False
+DEFAULT_ALERT_DESCRIPTIONS = False
+DEFAULT_API_KEY_POOL = ""
 DEFAULT_ATTRIBUTION = "Powered by Weatherbit.io"
+DEFAULT_DAILY_CALL_BUDGET = 50
 DEFAULT_INTERVAL_SENSORS = 60
 DEFAULT_INTERVAL_FORECAST = 60
 DEFAULT_BRAND = "Weatherbit.io"
 DEFAULT_FORECAST_LANGUAGE = "en"
+DEFAULT_FORECAST_DAYS = 7
+DEFAULT_HOURLY_FORECAST = False
+DEFAULT_HOURLY_FORECAST_HOURS = 48
+DEFAULT_INTERPOLATION = False
+DEFAULT_SHARE_RADIUS = 0
 
 DOMAIN = "weatherbit"
 
+EVENT_ALERT_EXPIRED = f"{DOMAIN}_alert_expired"
+EVENT_ALERT_NEW = f"{DOMAIN}_alert_new"
+
+HANDOFF_MAX_AGE = timedelta(minutes=5)
+
+INTERPOLATION_BLEND = timedelta(hours=3)
+INTERPOLATION_INTERVAL = timedelta(minutes=5)
+
+MAX_FORECAST_DAYS = 16
+MAX_LOCATION_DECIMALS = 4
+MAX_PARALLEL_REQUESTS = 4
+MAX_SHARE_RADIUS = 5000
+
+STATION_DATA_MAX_AGE = timedelta(days=1)
+STORAGE_SAVE_DELAY = 10
+STORAGE_VERSION = 1
+
 TRANSLATION_BEAUFORT = "beaufort"
 TRANSLATION_CARDINAL = "wind_cardinal"
 TRANSLATION_UV_DESCRIPTION = "uv_description"
@@ -0,0 +1,121 @@
+"""Data update coordinators for the Weatherbit integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.unit_system import METRIC_SYSTEM
+from pyweatherbitdata.exceptions import WeatherbitError
+from pyweatherbitdata.data import ForecastDescription
+
+from .alerts import WeatherBitAlert, WeatherBitAlerts
+from .const import EVENT_ALERT_EXPIRED, EVENT_ALERT_NEW
+from .forecast import WeatherBitForecastTable
+from .stats import WeatherBitApiStats
+
+
+class WeatherBitDataUpdateCoordinator(DataUpdateCoordinator):
+    """Coordinator whose update interval can be changed while it is running."""
+
+    def __init__(
+        self, *args: Any, stats: WeatherBitApiStats | None = None, **kwargs: Any
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+
+    async def _async_update_data(self) -> Any:
+        """Fetch the data, counting failed updates by the error behind them."""
+        try:
+            return await super()._async_update_data()
+        except UpdateFailed as err:
+            if self.stats is not None:
+                self.stats.async_record_failure(err.__cause__ or err)
+            raise
+        except WeatherbitError as err:
+            if self.stats is not None:
+                self.stats.async_record_failure(err)
+            raise
+
+    @callback
+    def async_set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the update interval and reschedule a pending refresh."""
+        if update_interval == self.update_interval:
+            return
+        self.update_interval = update_interval
+        if self._unsub_refresh is not None:
+            self._schedule_refresh()
+
+    async def _handle_refresh_interval(self, _now: datetime) -> None:
+        """Handle a refresh interval occurrence.
+
+        A refresh rescheduled between the timer firing and this running would
+        be left behind and cost an extra call, so it is cancelled first.
+        """
+        self._async_unsub_refresh()
+        await super()._handle_refresh_interval(_now)
+
+
+class WeatherBitForecastCoordinator(WeatherBitDataUpdateCoordinator):
+    """Coordinator for the forecast, converting each new forecast once."""
+
+    table: WeatherBitForecastTable | None = None
+
+    async def _async_update_data(self) -> ForecastDescription:
+        """Fetch the forecast and build the converted forecast table."""
+        data: ForecastDescription | None = await super()._async_update_data()
+        self.table = (
+            None
+            if data is None
+            else WeatherBitForecastTable.from_forecast(
+                data, self.hass.config.units is METRIC_SYSTEM
+            )
+        )
+        return data
+
+
+class WeatherBitAlertsCoordinator(WeatherBitDataUpdateCoordinator):
+    """Coordinator for the weather alerts, firing an event when one comes or goes.
+
+    Each fetch is compared by uri with the alerts known before, and only the
+    difference is kept, so an alert is announced once and not on every poll.
+    The alerts known before a restart are passed in from the store. The
+    markdown for dashboards is rendered once when the alerts change.
+    """
+
+    def __init__(
+        self, *args: Any, known: WeatherBitAlerts | None = None, **kwargs: Any
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self.known = known
+        self.new: list[WeatherBitAlert] = []
+        self.expired: list[WeatherBitAlert] = []
+        self.markdown: str | None = None
+
+    async def _async_update_data(self) -> WeatherBitAlerts | None:
+        """Fetch the alerts and fire events for the ones new or expired."""
+        data: WeatherBitAlerts | None = await super()._async_update_data()
+        if data is None:
+            return None
+        self.new, self.expired = data.diff(self.known)
+        if self.markdown is None or data != self.known:
+            self.markdown = data.as_markdown()
+        self.known = data
+        for event_type, alerts in (
+            (EVENT_ALERT_NEW, self.new),
+            (EVENT_ALERT_EXPIRED, self.expired),
+        ):
+            for alert in alerts:
+                self.hass.bus.async_fire(event_type, self._event_data(alert))
+        return data
+
+    def _event_data(self, alert: WeatherBitAlert) -> dict[str, Any]:
+        """Return the data of an alert event, including the descriptions."""
+        return {
+            "entry_id": self.config_entry.entry_id if self.config_entry else None,
+            "location": self.config_entry.title if self.config_entry else None,
+            **alert.as_attributes(descriptions=True),
+        }
@@ -0,0 +1,91 @@
+"""Diagnostics support for the Weatherbit integration."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY_POOL, CONF_BASE_URL, DOMAIN
+from .coordinator import WeatherBitDataUpdateCoordinator
+from .models import WeatherBitEntryData
+
+TO_REDACT = {
+    CONF_API_KEY,
+    CONF_API_KEY_POOL,
+    CONF_BASE_URL,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    "latitude",
+    "longitude",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data: WeatherBitEntryData = hass.data[DOMAIN][entry.entry_id]
+    scheduler = entry_data.weatherbitapi.key_client.scheduler
+
+    coordinators = {
+        "sensors": entry_data.coordinator,
+        "forecast": entry_data.forecast_coordinator,
+        "hourly": entry_data.hourly_coordinator,
+        "alerts": entry_data.alerts_coordinator,
+    }
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "call_budget": {
+            "daily_budget": scheduler.daily_budget,
+            "calls_today": scheduler.calls_today,
+            "remaining_calls": scheduler.remaining_calls,
+            "keys": scheduler.pool.as_dict(),
+        },
+        "requests": entry_data.weatherbitapi.stats.as_dict(),
+        "coordinators": {
+            name: _coordinator_diagnostics(coordinator)
+            for name, coordinator in coordinators.items()
+            if coordinator is not None
+        },
+        "adaptive_polling": entry_data.activity.as_dict()
+        if entry_data.activity is not None
+        else None,
+        "observation_cadence": entry_data.cadence.as_dict()
+        if entry_data.cadence is not None
+        else None,
+        "interpolation": entry_data.interpolator.as_dict()
+        if entry_data.interpolator is not None
+        else None,
+        "entities": asdict(entry_data.entity_stats),
+    }
+
+
+def _coordinator_diagnostics(
+    coordinator: WeatherBitDataUpdateCoordinator,
+) -> dict[str, Any]:
+    """Return the state of a coordinator."""
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "last_exception": _exception_name(coordinator.last_exception),
+        "update_interval": str(coordinator.update_interval),
+        "has_data": coordinator.data is not None,
+    }
+
+
+def _exception_name(err: Exception | None) -> str | None:
+    """Return the type of the error behind an update failure.
+
+    The message is left out, as it holds the request URL with the API key and
+    the location.
+    """
+    if err is None:
+        return None
+    return type(err.__cause__ or err).__name__
@@ -2,14 +2,25 @@
 from __future__ import annotations
 
 import logging
+import time
+from typing import Any
 
 import homeassistant.helpers.device_registry as dr
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DEFAULT_ATTRIBUTION, DEFAULT_BRAND, DOMAIN
+from .const import (
+    DATA_SOURCE_BOTH,
+    DATA_SOURCE_FORECAST,
+    DATA_SOURCE_OBSERVATION,
+    DEFAULT_ATTRIBUTION,
+    DEFAULT_BRAND,
+    DOMAIN,
+)
+from .models import WeatherBitEntryData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +59,7 @@ class WeatherbitEntity(Entity):
             connections={(dr.CONNECTION_NETWORK_MAC, self.entry.unique_id)},
             configuration_url="https://www.weatherbit.io/",
         )
+        self._last_fingerprint: Any = None
 
     @property
     def extra_state_attributes(self):
@@ -58,10 +70,47 @@ class WeatherbitEntity(Entity):
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
+        entry_data: WeatherBitEntryData = self.hass.data[DOMAIN][self.entry.entry_id]
+        self.entry_stats = entry_data.entity_stats
+        # The state is written right after this with the same data.
+        self._last_fingerprint = self._state_fingerprint()
+
+        data_source = self.entity_description.data_source
+        if data_source in (DATA_SOURCE_OBSERVATION, DATA_SOURCE_BOTH):
+            self.async_on_remove(
+                self.coordinator.async_add_listener(self._handle_coordinator_update)
+            )
+
+        if data_source in (DATA_SOURCE_FORECAST, DATA_SOURCE_BOTH):
+            self.async_on_remove(
+                self.forecast_coordinator.async_add_listener(
+                    self._handle_coordinator_update
+                )
+            )
 
-        self.async_on_remove(
-            self.forecast_coordinator.async_add_listener(self.async_write_ha_state)
+    def _state_fingerprint(self) -> Any:
+        """Return a value that changes when the written state would change."""
+        if not self.available:
+            return (False,)
+        return (
+            True,
+            self.state,
+            self.icon,
+            self.extra_state_attributes,
         )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless nothing changed since the last write."""
+        start = time.perf_counter()
+        try:
+            fingerprint = self._state_fingerprint()
+            if fingerprint == self._last_fingerprint:
+                self.entry_stats.state_writes_suppressed += 1
+                return
+
+            self._last_fingerprint = fingerprint
+            self.entry_stats.state_writes += 1
+            self.async_write_ha_state()
+        finally:
+            self.entry_stats.compute_time += time.perf_counter() - start
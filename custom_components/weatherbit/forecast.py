@@ -0,0 +1,240 @@
+"""Forecast tables for the Weatherbit integration."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from math import isnan, nan
+from typing import Any
+
+from homeassistant.const import UnitOfLength, UnitOfSpeed, UnitOfTemperature
+from homeassistant.util.unit_conversion import (
+    DistanceConverter,
+    SpeedConverter,
+    TemperatureConverter,
+)
+import homeassistant.util.dt as dt_util
+from pyweatherbitdata.data import ForecastDescription
+from pyweatherbitdata.helpers import Conversions
+
+# Numeric hourly columns and the field of the API response they come from.
+HOURLY_COLUMNS: dict[str, str] = {
+    "temp": "temp",
+    "app_temp": "app_temp",
+    "humidity": "rh",
+    "pres": "pres",
+    "slp": "slp",
+    "clouds": "clouds",
+    "wind_spd": "wind_spd",
+    "wind_gust_spd": "wind_gust_spd",
+    "wind_dir": "wind_dir",
+    "dewpt": "dewpt",
+    "pop": "pop",
+    "vis": "vis",
+    "precip": "precip",
+    "snow": "snow",
+    "uv": "uv",
+    "ozone": "ozone",
+}
+
+
+@dataclass(frozen=True)
+class WeatherBitForecastTable:
+    """Daily forecast in the Home Assistant unit system, stored by column.
+
+    Row n of every column holds the values for day n of the forecast.
+    """
+
+    utc_time: tuple[str, ...]
+    condition: tuple[str | None, ...]
+    weather_text: tuple[str | None, ...]
+    temp: tuple[float | None, ...]
+    temp_low: tuple[float | None, ...]
+    precip: tuple[float | None, ...]
+    snow: tuple[float | None, ...]
+    pop: tuple[int | None, ...]
+    clouds: tuple[int | None, ...]
+    wind_spd: tuple[float | None, ...]
+    wind_dir: tuple[int | None, ...]
+
+    def __len__(self) -> int:
+        """Return the number of forecast days."""
+        return len(self.utc_time)
+
+    @classmethod
+    def from_forecast(
+        cls, forecast: ForecastDescription, is_metric: bool
+    ) -> WeatherBitForecastTable:
+        """Convert all days of a forecast in one pass."""
+        days = forecast.forecast
+
+        if is_metric:
+            temp = tuple(day.max_temp for day in days)
+            temp_low = tuple(day.min_temp for day in days)
+            precip = tuple(_round(day.precip, 3) for day in days)
+            snow = tuple(_round(day.snow, 3) for day in days)
+            wind_spd = tuple(_round(day.wind_spd, 2) for day in days)
+        else:
+            to_fahrenheit = TemperatureConverter.converter_factory_allow_none(
+                UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT
+            )
+            to_inches = DistanceConverter.converter_factory_allow_none(
+                UnitOfLength.MILLIMETERS, UnitOfLength.INCHES
+            )
+            to_mph = SpeedConverter.converter_factory_allow_none(
+                UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR
+            )
+            temp = tuple(to_fahrenheit(day.max_temp) for day in days)
+            temp_low = tuple(to_fahrenheit(day.min_temp) for day in days)
+            precip = tuple(_round(to_inches(day.precip), 3) for day in days)
+            snow = tuple(_round(to_inches(day.snow), 3) for day in days)
+            wind_spd = tuple(_round(to_mph(day.wind_spd), 2) for day in days)
+
+        return cls(
+            utc_time=tuple(day.utc_time for day in days),
+            condition=tuple(day.condition for day in days),
+            weather_text=tuple(day.weather_text for day in days),
+            temp=temp,
+            temp_low=temp_low,
+            precip=precip,
+            snow=snow,
+            pop=tuple(day.pop for day in days),
+            clouds=tuple(day.clouds for day in days),
+            wind_spd=wind_spd,
+            wind_dir=tuple(day.wind_dir for day in days),
+        )
+
+
+@dataclass(frozen=True)
+class WeatherBitHourlyForecast:
+    """Hourly forecast in metric units, stored by column in fixed size arrays.
+
+    utc_time holds the start of each hour as a POSIX timestamp, and row n of
+    every column holds the values for that hour. A missing number is stored
+    as NaN. Compared to one description object per hour, this keeps 240 hours
+    for many locations small.
+    """
+
+    city_name: str | None
+    utc_time: array
+    columns: dict[str, array]
+    condition: tuple[str | None, ...]
+    weather_text: tuple[str | None, ...]
+
+    def __len__(self) -> int:
+        """Return the number of forecast hours."""
+        return len(self.utc_time)
+
+    @classmethod
+    def from_response(
+        cls, response: dict[str, Any], cnv: Conversions
+    ) -> WeatherBitHourlyForecast:
+        """Convert the response of the hourly forecast endpoint."""
+        hours: list[dict[str, Any]] = response["data"]
+        return cls(
+            city_name=response["city_name"],
+            utc_time=array(
+                "d",
+                (
+                    dt_util.parse_datetime(hour["timestamp_utc"])
+                    .replace(tzinfo=dt_util.UTC)
+                    .timestamp()
+                    for hour in hours
+                ),
+            ),
+            columns={
+                column: array("d", (_number(hour[field]) for hour in hours))
+                for column, field in HOURLY_COLUMNS.items()
+            },
+            condition=tuple(
+                cnv.condition_from_code(hour["weather"]["code"], hour["pod"] == "n")
+                for hour in hours
+            ),
+            weather_text=tuple(hour["weather"]["description"] for hour in hours),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WeatherBitHourlyForecast:
+        """Rebuild a forecast from its stored form."""
+        return cls(
+            city_name=data["city_name"],
+            utc_time=array("d", data["utc_time"]),
+            columns={
+                column: array("d", map(_number, data["columns"][column]))
+                for column in HOURLY_COLUMNS
+            },
+            condition=tuple(data["condition"]),
+            weather_text=tuple(data["weather_text"]),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the forecast in a form that can be stored as JSON."""
+        return {
+            "city_name": self.city_name,
+            "utc_time": self.utc_time.tolist(),
+            "columns": {
+                column: [self.value(column, index) for index in range(len(self))]
+                for column in self.columns
+            },
+            "condition": list(self.condition),
+            "weather_text": list(self.weather_text),
+        }
+
+    def index_at(self, time: datetime) -> int | None:
+        """Return the row of the hour a time falls in."""
+        index = bisect_right(self.utc_time, time.timestamp()) - 1
+        if index < 0 or index >= len(self):
+            return None
+        return index
+
+    def time_at(self, index: int) -> str:
+        """Return the start of the hour of a row in ISO format."""
+        return datetime.fromtimestamp(self.utc_time[index], dt_util.UTC).isoformat()
+
+    def value(self, column: str, index: int) -> float | int | None:
+        """Return a value, or None if it is missing."""
+        value = self.columns[column][index]
+        if isnan(value):
+            return None
+        return int(value) if column in _INTEGER_COLUMNS else value
+
+    def native_value(
+        self, column: str, index: int, is_metric: bool
+    ) -> float | int | None:
+        """Return a value in the Home Assistant unit system."""
+        value = self.value(column, index)
+        if is_metric or value is None or column not in _TO_IMPERIAL:
+            return value
+        return round(_TO_IMPERIAL[column](value), 2)
+
+
+_INTEGER_COLUMNS = {"humidity", "clouds", "wind_dir", "pop"}
+_TO_FAHRENHEIT = TemperatureConverter.converter_factory(
+    UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT
+)
+_TO_INCHES = DistanceConverter.converter_factory(
+    UnitOfLength.MILLIMETERS, UnitOfLength.INCHES
+)
+_TO_MPH = SpeedConverter.converter_factory(
+    UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR
+)
+_TO_IMPERIAL = {
+    "temp": _TO_FAHRENHEIT,
+    "app_temp": _TO_FAHRENHEIT,
+    "dewpt": _TO_FAHRENHEIT,
+    "precip": _TO_INCHES,
+    "snow": _TO_INCHES,
+    "wind_spd": _TO_MPH,
+    "wind_gust_spd": _TO_MPH,
+}
+
+
+def _number(value: Any) -> float:
+    """Return a value as a float, with NaN for a missing value."""
+    return nan if value is None else float(value)
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """Round a value that may be missing."""
+    return None if value is None else round(value, digits)
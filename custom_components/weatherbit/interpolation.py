@@ -0,0 +1,185 @@
+"""Estimated observations between polls for the Weatherbit integration."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from math import isnan, nan
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+from pyweatherbitdata.data import ObservationDescription
+from pyweatherbitdata.helpers import Conversions
+
+from .const import INTERPOLATION_BLEND, INTERPOLATION_INTERVAL
+from .forecast import WeatherBitHourlyForecast
+
+# Observation field: hourly forecast field, unit conversion and decimals.
+INTERPOLATED_FIELDS: dict[str, tuple[str, str | None, int]] = {
+    "temp": ("temp", "temperature", 1),
+    "dewpt": ("dewpt", "temperature", 1),
+    "humidity": ("humidity", None, 0),
+    "pres": ("pres", "pressure", 1),
+    "slp": ("slp", "pressure", 1),
+    "clouds": ("clouds", None, 0),
+    "wind_spd": ("wind_spd", "windspeed", 1),
+    "wind_spd_kmh": ("wind_spd", "windspeed_kmh", 1),
+    "wind_spd_knots": ("wind_spd", "windspeed_knots", 1),
+    "vis": ("vis", "distance", 1),
+    "uv": ("uv", None, 1),
+}
+
+
+class WeatherBitInterpolator:
+    """Blend the last observation into the hourly forecast.
+
+    The columns of the hourly forecast are turned into one row of values per
+    hour, holding every field in INTERPOLATED_FIELDS, converted to the units
+    of the observation.
+    An estimate is the forecast at that time, linearly interpolated between
+    the hours around it, plus the difference between the observation and the
+    forecast at the observation time. The difference fades out over
+    INTERPOLATION_BLEND, and all fields are computed in one pass.
+    """
+
+    def __init__(self, cnv: Conversions) -> None:
+        """Initialize the interpolator."""
+        self._cnv = cnv
+        self._times: Sequence[float] = ()
+        self._rows: list[tuple[float, ...]] = []
+        self._observation_time: float | None = None
+        self._observed: tuple[float, ...] | None = None
+        self._correction: tuple[float, ...] | None = None
+        self._listeners: dict[CALLBACK_TYPE, Callable[[], None]] = {}
+        self.values: dict[str, float | int] = {}
+        self.estimated_at: datetime | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for new estimates."""
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.pop(remove_listener)
+
+        self._listeners[remove_listener] = update_callback
+        return remove_listener
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> CALLBACK_TYPE:
+        """Estimate new values every INTERPOLATION_INTERVAL."""
+        return async_track_time_interval(
+            hass, self._async_handle_interval, INTERPOLATION_INTERVAL
+        )
+
+    @callback
+    def async_set_forecast(self, forecast: WeatherBitHourlyForecast | None) -> None:
+        """Convert the columns of a new hourly forecast to rows of values."""
+        if forecast is None:
+            return
+        columns = []
+        for field, conversion, _digits in INTERPOLATED_FIELDS.values():
+            convert = getattr(self._cnv, conversion) if conversion else None
+            columns.append(
+                [
+                    value if convert is None or isnan(value) else convert(value)
+                    for value in forecast.columns[field]
+                ]
+            )
+        self._times = forecast.utc_time
+        self._rows = list(zip(*columns))
+        self._async_update_correction()
+        self._async_estimate()
+
+    @callback
+    def async_set_observation(self, observation: ObservationDescription | None) -> None:
+        """Use a new observation as the starting point of the estimates."""
+        if observation is None:
+            return
+        time = observation.observation_time
+        if not isinstance(time, datetime):
+            time = dt_util.utcnow()
+        self._observation_time = time.timestamp()
+        self._observed = tuple(
+            _value(getattr(observation, key)) for key in INTERPOLATED_FIELDS
+        )
+        self._async_update_correction()
+        self._async_estimate()
+
+    @callback
+    def _async_update_correction(self) -> None:
+        """Compute how far the observation is from the forecast."""
+        if self._observed is None or self._observation_time is None:
+            return
+        forecast = self._forecast_at(self._observation_time)
+        if forecast is None:
+            self._correction = None
+            return
+        self._correction = tuple(
+            observed - expected for observed, expected in zip(self._observed, forecast)
+        )
+
+    @callback
+    def _async_handle_interval(self, _now: datetime) -> None:
+        """Estimate new values and tell the listeners."""
+        self._async_estimate()
+        for update_callback in list(self._listeners.values()):
+            update_callback()
+
+    @callback
+    def _async_estimate(self) -> None:
+        """Estimate all fields for the current time."""
+        now = dt_util.utcnow()
+        forecast = self._forecast_at(now.timestamp())
+        if forecast is None or self._correction is None:
+            self.values = {}
+            self.estimated_at = None
+            return
+
+        age = now.timestamp() - self._observation_time
+        weight = max(1 - age / INTERPOLATION_BLEND.total_seconds(), 0)
+        values = (
+            expected + weight * correction
+            for expected, correction in zip(forecast, self._correction)
+        )
+        self.values = {
+            key: round(value, digits) if digits else round(value)
+            for (key, (_field, _conversion, digits)), value in zip(
+                INTERPOLATED_FIELDS.items(), values
+            )
+            if not isnan(value)
+        }
+        self.estimated_at = now
+
+    def _forecast_at(self, timestamp: float) -> tuple[float, ...] | None:
+        """Return the forecast for a time between two forecast hours."""
+        index = bisect_right(self._times, timestamp)
+        if index == 0 and self._times and self._times[0] - timestamp < 3600:
+            # The observation is often from just before the first hour.
+            return self._rows[0]
+        if index == 0 or index == len(self._times):
+            # Outside the forecast.
+            return None
+        start, end = self._times[index - 1], self._times[index]
+        fraction = (timestamp - start) / (end - start)
+        return tuple(
+            before + (after - before) * fraction
+            for before, after in zip(self._rows[index - 1], self._rows[index])
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the interpolator for diagnostics."""
+        return {
+            "forecast_hours": len(self._times),
+            "estimated_at": self.estimated_at.isoformat()
+            if self.estimated_at
+            else None,
+            "values": self.values,
+        }
+
+
+def _value(value: Any) -> float:
+    """Return a value as a float, with NaN for a missing value."""
+    return nan if value is None else float(value)
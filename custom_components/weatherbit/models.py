@@ -1,20 +1,46 @@
 """The WeatherBit integration models."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from pyweatherbitdata import WeatherBitApiClient
 from pyweatherbitdata.data import BaseDataDescription
 
+from .adaptive import WeatherBitActivityTracker
+from .api import WeatherBitApi
+from .cadence import WeatherBitPublishCadence
+from .coordinator import (
+    WeatherBitAlertsCoordinator,
+    WeatherBitDataUpdateCoordinator,
+    WeatherBitForecastCoordinator,
+)
+from .interpolation import WeatherBitInterpolator
+from .store import WeatherBitDataStore
+
+
+@dataclass
+class WeatherBitEntityStats:
+    """Counters for the entity state updates of an entry."""
+
+    state_writes: int = 0
+    state_writes_suppressed: int = 0
+    compute_time: float = 0.0
+
 
 @dataclass
 class WeatherBitEntryData:
     """Data for the weatherbit integration."""
 
-    weatherbitapi: WeatherBitApiClient
-    coordinator: DataUpdateCoordinator
-    forecast_coordinator: DataUpdateCoordinator
+    weatherbitapi: WeatherBitApi
+    coordinator: WeatherBitDataUpdateCoordinator
+    forecast_coordinator: WeatherBitForecastCoordinator
     station_data: BaseDataDescription
     unit_descriptions: dict[str, Any]
+    store: WeatherBitDataStore
+    hourly_coordinator: WeatherBitDataUpdateCoordinator | None = None
+    alerts_coordinator: WeatherBitAlertsCoordinator | None = None
+    activity: WeatherBitActivityTracker | None = None
+    cadence: WeatherBitPublishCadence | None = None
+    interpolator: WeatherBitInterpolator | None = None
+    options: dict[str, Any] = field(default_factory=dict)
+    entity_stats: WeatherBitEntityStats = field(default_factory=WeatherBitEntityStats)
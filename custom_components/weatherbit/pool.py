@@ -0,0 +1,163 @@
+"""Pooled API keys for the Weatherbit integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import hashlib
+import logging
+from typing import Any
+
+from homeassistant.core import callback
+from pyweatherbitdata import InvalidApiKey, RequestError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(RequestError):
+    """Raised when the API answers that a key is over its quota."""
+
+
+@dataclass
+class PooledKey:
+    """An API key of a pool and how it has fared today."""
+
+    api_key: str
+    calls_today: int = 0
+    invalid: bool = False
+    rate_limited: bool = False
+    entry_ids: set[str] = field(default_factory=set)
+
+    @property
+    def usable(self) -> bool:
+        """Return True if requests can be made with the key."""
+        return not (self.invalid or self.rate_limited)
+
+
+class WeatherBitKeyPool:
+    """Spread the requests of a key client over several API keys.
+
+    The first key is the one the entries were set up with. Entries can add
+    more keys, which are registered once for all entries of that key. Every
+    request uses the usable key with the most calls left today, so all keys
+    run down at the same rate. A key rejected as invalid is not used again
+    until the entries adding it are reloaded, and a key over its quota is not
+    used again until the quota resets at midnight UTC.
+    """
+
+    def __init__(self, api_key: str) -> None:
+        """Initialize the pool."""
+        self.api_key = api_key
+        self._keys: dict[str, PooledKey] = {api_key: PooledKey(api_key)}
+        self._restored: dict[str, int] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the number of usable keys, counting the first key at least."""
+        return max(sum(key.usable for key in self._keys.values()), 1)
+
+    def remaining_calls(self, key_budget: int) -> int:
+        """Return the calls left today on all usable keys."""
+        return sum(
+            max(key_budget - key.calls_today, 0)
+            for key in self._keys.values()
+            if key.usable
+        )
+
+    @callback
+    def async_add(self, entry_id: str, api_keys: Iterable[str]) -> None:
+        """Add the keys of an entry to the pool."""
+        for api_key in api_keys:
+            if (key := self._keys.get(api_key)) is None:
+                key = self._keys[api_key] = PooledKey(
+                    api_key, self._restored.get(key_digest(api_key), 0)
+                )
+            key.entry_ids.add(entry_id)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Remove the keys only an entry added, forgetting why they failed."""
+        for api_key, key in list(self._keys.items()):
+            key.entry_ids.discard(entry_id)
+            if api_key != self.api_key and not key.entry_ids:
+                del self._keys[api_key]
+
+    @callback
+    def async_pick(self) -> str:
+        """Return the key with the most calls left today.
+
+        When no key is usable, the first key is used, as without a pool.
+        """
+        usable = [key for key in self._keys.values() if key.usable]
+        if not usable:
+            return self.api_key
+        return min(usable, key=lambda key: key.calls_today).api_key
+
+    @callback
+    def async_record_call(self, api_key: str) -> None:
+        """Count a request against the quota of a key."""
+        if (key := self._keys.get(api_key)) is not None:
+            key.calls_today += 1
+
+    @callback
+    def async_fail_over(self, api_key: str, err: Exception) -> bool:
+        """Stop using a key the API rejected.
+
+        Returns True if the request can be made again with another key.
+        """
+        if (key := self._keys.get(api_key)) is None:
+            return False
+        if isinstance(err, InvalidApiKey):
+            key.invalid = True
+        elif isinstance(err, RateLimitExceeded):
+            key.rate_limited = True
+        else:
+            return False
+        if len(self._keys) > 1:
+            _LOGGER.warning(
+                "API key ending in %s is %s, using the other keys of the pool",
+                api_key[-4:],
+                "not valid" if key.invalid else "over its daily quota",
+            )
+        return any(item.usable for item in self._keys.values())
+
+    @callback
+    def async_restore(self, calls: dict[str, int]) -> None:
+        """Add the calls made today before a restart, by key digest.
+
+        Keys added to the pool later start from their saved calls too.
+        """
+        self._restored = dict(calls)
+        for api_key, key in self._keys.items():
+            key.calls_today += calls.get(key_digest(api_key), 0)
+
+    @callback
+    def async_reset(self) -> None:
+        """Start a new quota day."""
+        self._restored = {}
+        for key in self._keys.values():
+            key.calls_today = 0
+            key.rate_limited = False
+
+    def calls_by_digest(self) -> dict[str, int]:
+        """Return the calls made today with each key, by key digest, to be saved."""
+        return {
+            **self._restored,
+            **{key_digest(api_key): key.calls_today for api_key, key in self._keys.items()},
+        }
+
+    def as_dict(self) -> list[dict[str, Any]]:
+        """Return the state of the keys for diagnostics, without the keys."""
+        return [
+            {
+                "key_ending": api_key[-4:],
+                "calls_today": key.calls_today,
+                "invalid": key.invalid,
+                "rate_limited": key.rate_limited,
+            }
+            for api_key, key in self._keys.items()
+        ]
+
+
+def key_digest(api_key: str) -> str:
+    """Return a short digest of an API key, to save data by key without the key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
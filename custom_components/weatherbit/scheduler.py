@@ -0,0 +1,224 @@
+"""Daily call budget scheduling for the Weatherbit integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import CALL_BUDGET_RESERVE, DEFAULT_DAILY_CALL_BUDGET, STORAGE_SAVE_DELAY
+from .coordinator import WeatherBitDataUpdateCoordinator
+from .pool import WeatherBitKeyPool
+
+_LOGGER = logging.getLogger(__name__)
+
+_KEY_DATE = "date"
+_KEY_CALLS_TODAY = "calls_today"
+_KEY_KEYS = "keys"
+
+
+@dataclass
+class ScheduledCoordinator:
+    """A coordinator polling against the daily call budget."""
+
+    coordinator: WeatherBitDataUpdateCoordinator
+    min_interval: timedelta
+    daily_budget: int
+    weight: float = 1.0
+
+
+class WeatherBitCallScheduler:
+    """Spread the daily call budget of one API key over all its coordinators.
+
+    Weatherbit resets the quota at midnight UTC. Every coordinator gets a
+    share of the calls left today in proportion to its weight, and its update
+    interval is set so that share lasts until the reset, but never below the
+    configured interval. All weights are 1 unless adaptive polling is used.
+    With a pool of API keys the budget is that of one key times the number
+    of usable keys. The calls made today are saved with their UTC date, so
+    they still count after a restart or reload.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pool: WeatherBitKeyPool,
+        store: Store[dict[str, Any]],
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.pool = pool
+        self.calls_today = 0
+        self._store = store
+        self._load_task: asyncio.Task[None] | None = None
+        self._scheduled: dict[tuple[str, str], ScheduledCoordinator] = {}
+        self._unsub_reset: CALLBACK_TYPE | None = None
+
+    @property
+    def key_budget(self) -> int:
+        """Return the daily budget of one key, the lowest configured by any entry."""
+        if not self._scheduled:
+            return DEFAULT_DAILY_CALL_BUDGET
+        return min(item.daily_budget for item in self._scheduled.values())
+
+    @property
+    def daily_budget(self) -> int:
+        """Return the daily budget of all usable keys."""
+        return self.key_budget * self.pool.size
+
+    @property
+    def remaining_calls(self) -> int:
+        """Return the number of calls left until the quota resets."""
+        return self.pool.remaining_calls(self.key_budget)
+
+    async def async_load(self) -> None:
+        """Restore the calls made today, once for all entries of the key."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(self._async_load())
+        await asyncio.shield(self._load_task)
+
+    async def _async_load(self) -> None:
+        """Add the saved calls if they were made on the current quota day."""
+        data = await self._store.async_load() or {}
+        if data.get(_KEY_DATE) != dt_util.utcnow().date().isoformat():
+            return
+        self.calls_today += data.get(_KEY_CALLS_TODAY, 0)
+        self.pool.async_restore(data.get(_KEY_KEYS, {}))
+        self.async_rebalance()
+
+    @callback
+    def async_register(
+        self,
+        entry_id: str,
+        kind: str,
+        coordinator: WeatherBitDataUpdateCoordinator,
+        min_interval: timedelta,
+        daily_budget: int,
+    ) -> CALLBACK_TYPE:
+        """Add a coordinator to the budget and return a callback to remove it."""
+        self._scheduled[(entry_id, kind)] = ScheduledCoordinator(
+            coordinator, min_interval, daily_budget
+        )
+        if self._unsub_reset is None:
+            self._async_schedule_reset()
+        self.async_rebalance(reschedule=True)
+
+        @callback
+        def _async_unregister() -> None:
+            self._scheduled.pop((entry_id, kind), None)
+            self.async_rebalance(reschedule=True)
+
+        return _async_unregister
+
+    @callback
+    def async_update_entry(
+        self, entry_id: str, min_intervals: dict[str, timedelta], daily_budget: int
+    ) -> None:
+        """Change the shortest intervals and the budget of an entry's coordinators.
+
+        Coordinators whose interval changes are rescheduled right away.
+        """
+        for (item_entry_id, kind), item in self._scheduled.items():
+            if item_entry_id == entry_id:
+                item.min_interval = min_intervals[kind]
+                item.daily_budget = daily_budget
+        self.async_rebalance(reschedule=True)
+
+    @callback
+    def async_set_weight(self, entry_id: str, kind: str, weight: float) -> None:
+        """Change the part of the budget a coordinator gets.
+
+        The new intervals are used from the next refresh on.
+        """
+        if (item := self._scheduled.get((entry_id, kind))) is None:
+            return
+        if item.weight != weight:
+            item.weight = weight
+            self.async_rebalance()
+
+    @callback
+    def async_record_call(self, api_key: str) -> None:
+        """Count a request with a key of the pool against today's quota."""
+        self.calls_today += 1
+        self.pool.async_record_call(api_key)
+        self._async_schedule_save()
+        self.async_rebalance()
+
+    @callback
+    def async_rebalance(self, reschedule: bool = False) -> None:
+        """Recalculate the update interval of every coordinator.
+
+        Without reschedule the new interval is used from the next refresh on.
+        """
+        if not self._scheduled:
+            return
+
+        now = dt_util.utcnow()
+        until_reset = _next_reset(now) - now
+        usable = max(self.remaining_calls - CALL_BUDGET_RESERVE, 0)
+        total_weight = sum(item.weight for item in self._scheduled.values())
+
+        for item in self._scheduled.values():
+            share = usable * item.weight / total_weight
+            if share >= 1:
+                interval = max(item.min_interval, until_reset / share)
+            else:
+                interval = max(item.min_interval, until_reset + timedelta(minutes=1))
+            interval = timedelta(seconds=round(interval.total_seconds()))
+            if reschedule:
+                item.coordinator.async_set_update_interval(interval)
+            else:
+                item.coordinator.update_interval = interval
+
+        _LOGGER.debug(
+            "%s calls left today shared by %s coordinators",
+            self.remaining_calls,
+            len(self._scheduled),
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the daily reset timer."""
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the calls made today after a short delay."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the calls made today with the UTC date they count for."""
+        return {
+            _KEY_DATE: dt_util.utcnow().date().isoformat(),
+            _KEY_CALLS_TODAY: self.calls_today,
+            _KEY_KEYS: self.pool.calls_by_digest(),
+        }
+
+    @callback
+    def _async_schedule_reset(self) -> None:
+        """Schedule the next quota reset."""
+        self._unsub_reset = async_track_point_in_utc_time(
+            self.hass, self._async_reset, _next_reset(dt_util.utcnow())
+        )
+
+    @callback
+    def _async_reset(self, _now: datetime) -> None:
+        """Start a new quota day."""
+        self.calls_today = 0
+        self.pool.async_reset()
+        self._async_schedule_save()
+        self._async_schedule_reset()
+        self.async_rebalance(reschedule=True)
+
+
+def _next_reset(now: datetime) -> datetime:
+    """Return the next midnight UTC."""
+    return datetime.combine(now.date() + timedelta(days=1), time.min, dt_util.UTC)
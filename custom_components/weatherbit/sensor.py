@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,21 +14,21 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     DEGREE,
-    UnitOfLength,
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.entity_registry as er
+from homeassistant.helpers.event import async_track_utc_time_change
 from homeassistant.helpers.typing import StateType
-from homeassistant.util.unit_conversion import (
-    SpeedConverter,
-    DistanceConverter,
-    TemperatureConverter,
-)
-from homeassistant.util.unit_system import (
-    METRIC_SYSTEM,
-)
+import homeassistant.util.dt as dt_util
+from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.components.weather import (
+    ATTR_FORECAST_HUMIDITY,
     ATTR_FORECAST_NATIVE_PRECIPITATION,
     ATTR_FORECAST_PRECIPITATION_PROBABILITY,
     ATTR_FORECAST_NATIVE_TEMP,
@@ -37,35 +38,46 @@ from homeassistant.components.weather import (
     ATTR_FORECAST_NATIVE_WIND_SPEED,
 )
 
-# from pyweatherbitdata.data import AlertDescription, ForecastDetailDescription
-from pyweatherbitdata.data import ForecastDetailDescription
 from .const import (
-    # ATTR_ALERTS_CITY_NAME,
-    # ATTR_ALERT_DESCRIPTION_EN,
-    # ATTR_ALERT_DESCRIPTION_LOC,
-    # ATTR_ALERT_EFFECTIVE,
-    # ATTR_ALERT_ENDS,
-    # ATTR_ALERT_EXPIRES,
-    # ATTR_ALERT_ONSET,
-    # ATTR_ALERT_REGIONS,
-    # ATTR_ALERT_SEVERITY,
-    # ATTR_ALERT_TITLE,
-    # ATTR_ALERT_URI,
-    # ATTR_ALERTS,
+    ATTR_ALERTS,
+    ATTR_ALERTS_CITY_NAME,
+    ATTR_ALERTS_MARKDOWN,
     ATTR_AQI_LEVEL,
+    ATTR_ESTIMATED,
     ATTR_FORECAST_CLOUDINESS,
     ATTR_FORECAST_SNOW,
     ATTR_FORECAST_WEATHER_TEXT,
+    ATTR_OBSERVED_VALUE,
+    CONF_ALERT_DESCRIPTIONS,
+    CONF_FORECAST_DAYS,
+    DATA_SOURCE_ALERTS,
+    DATA_SOURCE_BOTH,
+    DATA_SOURCE_FORECAST,
+    DATA_SOURCE_HOURLY,
+    DATA_SOURCE_OBSERVATION,
+    DEFAULT_ALERT_DESCRIPTIONS,
+    DEFAULT_FORECAST_DAYS,
     DOMAIN,
+    MAX_FORECAST_DAYS,
     TRANSLATION_BEAUFORT,
     TRANSLATION_CARDINAL,
     TRANSLATION_UV_DESCRIPTION,
 )
 from .entity import WeatherbitEntity
+from .interpolation import INTERPOLATED_FIELDS, WeatherBitInterpolator
 from .models import WeatherBitEntryData
 
-# _KEY_ALERTS = "alerts"
+_KEY_ALERTS = "alerts"
 _KEY_AQI = "aqi"
+_KEY_API_CALLS_TODAY = "api_calls_today"
+_KEY_API_CALLS_REMAINING = "api_calls_remaining"
+_KEY_API_FAILURES = "api_failures"
+_KEY_API_LATENCY_MAX = "api_latency_max"
+_KEY_API_LATENCY_P50 = "api_latency_p50"
+_KEY_API_LATENCY_P95 = "api_latency_p95"
+_KEY_CACHE_HIT_RATIO = "cache_hit_ratio"
+_KEY_ENTITY_UPDATE_TIME = "entity_update_time"
+_KEY_REPEATED_OBSERVATIONS = "repeated_observations"
 
 
 @dataclass(frozen=True,kw_only=True)
@@ -75,7 +87,10 @@ class WeatherBitRequiredKeysMixin:
     unit_type: str | None = None
     extra_attributes: bool | None = None
     day_index: int | None = None
+    hour_offset: int | None = None
     is_forecast_item: bool | None = False
+    is_diagnostic: bool = False
+    data_source: str = DATA_SOURCE_OBSERVATION
 
 
 #    translation_key: str | None = None
@@ -289,64 +304,143 @@ SENSOR_TYPES: tuple[WeatherBitSensorEntityDescription, ...] = (
         unit_type="none",
         extra_attributes=False,
     ),
-    # WeatherBitSensorEntityDescription(
-    #     key="alerts",
-    #     name="Weather Alerts",
-    #     icon="mdi:alert",
-    #     unit_type="none",
-    #     extra_attributes=True,
-    # ),
+)
+
+FORECAST_DAY_SENSOR_TYPES: tuple[WeatherBitSensorEntityDescription, ...] = tuple(
     WeatherBitSensorEntityDescription(
-        key="forecast_day_1",
-        name="Forecast Day 1",
+        key=f"forecast_day_{day + 1}",
+        name=f"Forecast Day {day + 1}",
         unit_type="none",
         is_forecast_item=True,
-        day_index=0,
-    ),
+        day_index=day,
+        data_source=DATA_SOURCE_FORECAST,
+    )
+    for day in range(MAX_FORECAST_DAYS)
+)
+
+HOURLY_SENSOR_TYPES: tuple[WeatherBitSensorEntityDescription, ...] = tuple(
     WeatherBitSensorEntityDescription(
-        key="forecast_day_2",
-        name="Forecast Day 2",
+        key=f"forecast_hour_{hours}",
+        name=f"Forecast Hour {hours}",
         unit_type="none",
-        is_forecast_item=True,
-        day_index=1,
-    ),
+        hour_offset=hours,
+        data_source=DATA_SOURCE_HOURLY,
+    )
+    for hours in (1, 2, 3, 6, 12, 24)
+)
+
+ALERT_SENSOR_TYPES: tuple[WeatherBitSensorEntityDescription, ...] = (
     WeatherBitSensorEntityDescription(
-        key="forecast_day_3",
-        name="Forecast Day 3",
+        key=_KEY_ALERTS,
+        name="Weather Alerts",
+        icon="mdi:alert",
         unit_type="none",
-        is_forecast_item=True,
-        day_index=2,
+        extra_attributes=True,
+        data_source=DATA_SOURCE_ALERTS,
+    ),
+)
+
+DIAGNOSTIC_SENSOR_TYPES: tuple[WeatherBitSensorEntityDescription, ...] = (
+    WeatherBitSensorEntityDescription(
+        key=_KEY_API_CALLS_TODAY,
+        name="API Calls Today",
+        icon="mdi:counter",
+        native_unit_of_measurement="calls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
     ),
     WeatherBitSensorEntityDescription(
-        key="forecast_day_4",
-        name="Forecast Day 4",
-        unit_type="none",
-        is_forecast_item=True,
-        day_index=3,
+        key=_KEY_API_CALLS_REMAINING,
+        name="API Calls Remaining",
+        icon="mdi:counter",
+        native_unit_of_measurement="calls",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
     ),
     WeatherBitSensorEntityDescription(
-        key="forecast_day_5",
-        name="Forecast Day 5",
-        unit_type="none",
-        is_forecast_item=True,
-        day_index=4,
+        key=_KEY_API_LATENCY_P50,
+        name="API Latency Median",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
     ),
     WeatherBitSensorEntityDescription(
-        key="forecast_day_6",
-        name="Forecast Day 6",
-        unit_type="none",
-        is_forecast_item=True,
-        day_index=5,
+        key=_KEY_API_LATENCY_P95,
+        name="API Latency 95th Percentile",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
     ),
     WeatherBitSensorEntityDescription(
-        key="forecast_day_7",
-        name="Forecast Day 7",
-        unit_type="none",
-        is_forecast_item=True,
-        day_index=6,
+        key=_KEY_API_LATENCY_MAX,
+        name="API Latency Max",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
+    ),
+    WeatherBitSensorEntityDescription(
+        key=_KEY_API_FAILURES,
+        name="API Failures",
+        icon="mdi:alert-circle-outline",
+        native_unit_of_measurement="failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
+    ),
+    WeatherBitSensorEntityDescription(
+        key=_KEY_CACHE_HIT_RATIO,
+        name="Cache Hit Ratio",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
+    ),
+    WeatherBitSensorEntityDescription(
+        key=_KEY_ENTITY_UPDATE_TIME,
+        name="Entity Update Time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
+    ),
+    WeatherBitSensorEntityDescription(
+        key=_KEY_REPEATED_OBSERVATIONS,
+        name="Repeated Observations",
+        icon="mdi:update",
+        native_unit_of_measurement="calls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        is_diagnostic=True,
+        data_source=DATA_SOURCE_BOTH,
     ),
 )
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -361,8 +455,24 @@ async def async_setup_entry(
     station_data = entry_data.station_data
     unit_descriptions = entry_data.unit_descriptions
 
+    hourly_coordinator = entry_data.hourly_coordinator
+    alerts_coordinator = entry_data.alerts_coordinator
+
+    forecast_days = entry.options.get(CONF_FORECAST_DAYS, DEFAULT_FORECAST_DAYS)
+    _async_remove_forecast_day_entities(hass, entry, forecast_days)
+
+    descriptions = [
+        *SENSOR_TYPES,
+        *FORECAST_DAY_SENSOR_TYPES[:forecast_days],
+        *DIAGNOSTIC_SENSOR_TYPES,
+    ]
+    if hourly_coordinator is not None:
+        descriptions.extend(HOURLY_SENSOR_TYPES)
+    if alerts_coordinator is not None:
+        descriptions.extend(ALERT_SENSOR_TYPES)
+
     entities = []
-    for description in SENSOR_TYPES:
+    for description in descriptions:
         entities.append(
             WeatherbitSensor(
                 weatherbitapi,
@@ -372,6 +482,8 @@ async def async_setup_entry(
                 description,
                 entry,
                 unit_descriptions,
+                hourly_coordinator,
+                alerts_coordinator,
             )
         )
 
@@ -383,9 +495,25 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+@callback
+def _async_remove_forecast_day_entities(
+    hass: HomeAssistant, entry: ConfigEntry, forecast_days: int
+) -> None:
+    """Remove the forecast day sensors beyond the configured number of days."""
+    entity_registry = er.async_get(hass)
+    for description in FORECAST_DAY_SENSOR_TYPES[forecast_days:]:
+        if entity_id := entity_registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.unique_id}_{description.key}"
+        ):
+            entity_registry.async_remove(entity_id)
+
+
 class WeatherbitSensor(WeatherbitEntity, SensorEntity):
     """Implementation of Weatherbit sensor."""
 
+    # The alert markdown holds the full alert texts, so it is not recorded.
+    _unrecorded_attributes = frozenset({ATTR_ALERTS_MARKDOWN})
+
     def __init__(
         self,
         weatherbitapi,
@@ -395,6 +523,8 @@ class WeatherbitSensor(WeatherbitEntity, SensorEntity):
         description,
         entries: ConfigEntry,
         unit_descriptions,
+        hourly_coordinator=None,
+        alerts_coordinator=None,
     ):
         """Initialize an WeatherFlow sensor."""
         super().__init__(
@@ -406,28 +536,84 @@ class WeatherbitSensor(WeatherbitEntity, SensorEntity):
             entries,
         )
         self.unit_descriptions = unit_descriptions
-        if self.entity_description.is_forecast_item:
-            self.forecast_data = getattr(self.forecast_coordinator.data, "forecast")
-            self.day_data: ForecastDetailDescription = self.forecast_data[
-                description.day_index
-            ]
+        self.hourly_coordinator = hourly_coordinator
+        self.alerts_coordinator = alerts_coordinator
+        self.interpolator: WeatherBitInterpolator | None = None
         self._attr_name = f"{DOMAIN.capitalize()} {self.entity_description.name}"
         if self.entity_description.native_unit_of_measurement is None:
             self._attr_native_unit_of_measurement = unit_descriptions[
                 self.entity_description.unit_type
             ]
 
+    async def async_added_to_hass(self):
+        """When entity is added to hass."""
+        if self.entity_description.key in INTERPOLATED_FIELDS:
+            entry_data: WeatherBitEntryData = self.hass.data[DOMAIN][
+                self.entry.entry_id
+            ]
+            self.interpolator = entry_data.interpolator
+        await super().async_added_to_hass()
+        if self.interpolator is not None:
+            self.async_on_remove(
+                self.interpolator.async_add_listener(self._handle_coordinator_update)
+            )
+        if self.entity_description.hour_offset is not None:
+            self.async_on_remove(
+                self.hourly_coordinator.async_add_listener(
+                    self._handle_coordinator_update
+                )
+            )
+            # The hour the sensor shows moves on every hour.
+            self.async_on_remove(
+                async_track_utc_time_change(
+                    self.hass, self._handle_hour_change, minute=0, second=0
+                )
+            )
+        if self.entity_description.data_source == DATA_SOURCE_ALERTS:
+            self.async_on_remove(
+                self.alerts_coordinator.async_add_listener(
+                    self._handle_coordinator_update
+                )
+            )
+
+    @callback
+    def _handle_hour_change(self, _now: datetime) -> None:
+        """Show the next forecast hour."""
+        self._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return if the data for the sensor is available."""
+        if self.entity_description.is_diagnostic:
+            return True
+        if self.entity_description.is_forecast_item:
+            table = self.forecast_coordinator.table
+            return table is not None and self.entity_description.day_index < len(table)
+        if self.entity_description.hour_offset is not None:
+            return self._hour_index() is not None
+        if self.entity_description.data_source == DATA_SOURCE_ALERTS:
+            return self.alerts_coordinator.data is not None
+        return super().available
+
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-
-        # if self.entity_description.key == _KEY_ALERTS:
-        #     return getattr(self.coordinator.data, "alert_count")
+        if self.entity_description.is_diagnostic:
+            return self._diagnostic_value()
 
         if self.entity_description.is_forecast_item:
-            self.forecast_data = getattr(self.forecast_coordinator.data, "forecast")
-            self.day_data = self.forecast_data[self.entity_description.day_index]
-            return self.day_data.condition
+            return self.forecast_coordinator.table.condition[
+                self.entity_description.day_index
+            ]
+
+        if self.entity_description.hour_offset is not None:
+            return self.hourly_coordinator.data.condition[self._hour_index()]
+
+        if self.entity_description.key == _KEY_ALERTS:
+            return len(self.alerts_coordinator.data)
+
+        if (estimate := self._estimated_value()) is not None:
+            return estimate
 
         return (
             getattr(self.coordinator.data, self.entity_description.key)
@@ -438,108 +624,172 @@ class WeatherbitSensor(WeatherbitEntity, SensorEntity):
     @property
     def icon(self):
         """Return icon for the sensor."""
-        if self.entity_description.is_forecast_item:
-            icon = (
-                "partly-cloudy"
-                if self.day_data.condition == "partlycloudy"
-                else self.day_data.condition
-            )
+        condition = None
+        if self.entity_description.is_forecast_item and self.available:
+            condition = self.forecast_coordinator.table.condition[
+                self.entity_description.day_index
+            ]
+        elif self.entity_description.hour_offset is not None and self.available:
+            condition = self.hourly_coordinator.data.condition[self._hour_index()]
+        if condition is not None:
+            icon = "partly-cloudy" if condition == "partlycloudy" else condition
             return f"mdi:weather-{icon}"
         return self.entity_description.icon
 
     @property
     def extra_state_attributes(self):
         """Return the sensor state attributes."""
-        # if self.entity_description.key == _KEY_ALERTS:
-        #     data = []
-        #     count = 1
-        #     alerts: AlertDescription = getattr(
-        #         self.coordinator.data, self.entity_description.key
-        #     )
-        #     for item in alerts:
-        #         data.append(
-        #             {
-        #                 f"Alert No {count}": "-------------------",
-        #                 ATTR_ALERT_TITLE: item.title,
-        #                 ATTR_ALERT_SEVERITY: item.severity,
-        #                 ATTR_ALERT_EFFECTIVE: item.effective_utc,
-        #                 ATTR_ALERT_ONSET: item.onset_utc,
-        #                 ATTR_ALERT_ENDS: item.ends_utc,
-        #                 ATTR_ALERT_EXPIRES: item.expires_utc,
-        #                 ATTR_ALERT_URI: item.uri,
-        #                 ATTR_ALERTS_CITY_NAME: item.city_name,
-        #                 ATTR_ALERT_REGIONS: item.regions,
-        #                 ATTR_ALERT_DESCRIPTION_EN: item.en_description,
-        #                 ATTR_ALERT_DESCRIPTION_LOC: item.loc_description,
-        #             }
-        #         )
-        #         count += 1
-        #     return {
-        #         **super().extra_state_attributes,
-        #         ATTR_ALERTS: data,
-        #     }
-        if self.entity_description.is_forecast_item:
-            _wind_spd = (
-                SpeedConverter.convert(
-                    self.day_data.wind_spd,
-                    UnitOfSpeed.METERS_PER_SECOND,
-                    UnitOfSpeed.MILES_PER_HOUR,
-                )
-                if not self.hass.config.units is METRIC_SYSTEM
-                else SpeedConverter.convert(
-                    self.day_data.wind_spd,
-                    UnitOfSpeed.METERS_PER_SECOND,
-                    UnitOfSpeed.MILES_PER_HOUR,
-                )
-            )
-            _temp = (
-                self.day_data.max_temp
-                if self.hass.config.units is METRIC_SYSTEM
-                else TemperatureConverter.convert(
-                    self.day_data.max_temp,
-                    UnitOfTemperature.CELSIUS,
-                    UnitOfTemperature.FAHRENHEIT,
-                )
-            )
-            _temp_low = (
-                self.day_data.min_temp
-                if self.hass.config.units is METRIC_SYSTEM
-                else TemperatureConverter.convert(
-                    self.day_data.min_temp,
-                    UnitOfTemperature.CELSIUS,
-                    UnitOfTemperature.FAHRENHEIT,
-                )
-            )
-            _precip = (
-                self.day_data.precip
-                if self.hass.config.units is METRIC_SYSTEM
-                else DistanceConverter.convert(
-                    self.day_data.precip, UnitOfLength.MILLIMETERS, UnitOfLength.INCHES
-                )
-            )
-            _snow = (
-                self.day_data.snow
-                if self.hass.config.units is METRIC_SYSTEM
-                else DistanceConverter.convert(
-                    self.day_data.snow, UnitOfLength.MILLIMETERS, UnitOfLength.INCHES
-                )
+        if self.entity_description.key == _KEY_ALERTS:
+            alerts = self.alerts_coordinator.data
+            # The descriptions can be long, so they are only added if asked for.
+            descriptions = self.entry.options.get(
+                CONF_ALERT_DESCRIPTIONS, DEFAULT_ALERT_DESCRIPTIONS
             )
             return {
                 **super().extra_state_attributes,
-                ATTR_FORECAST_TIME: self.day_data.utc_time,
-                ATTR_FORECAST_NATIVE_TEMP: _temp,
-                ATTR_FORECAST_NATIVE_TEMP_LOW: _temp_low,
-                ATTR_FORECAST_NATIVE_PRECIPITATION: round(_precip, 3),
-                ATTR_FORECAST_PRECIPITATION_PROBABILITY: self.day_data.pop,
-                ATTR_FORECAST_SNOW: round(_snow, 3),
-                ATTR_FORECAST_CLOUDINESS: self.day_data.clouds,
-                ATTR_FORECAST_WEATHER_TEXT: self.day_data.weather_text,
-                ATTR_FORECAST_NATIVE_WIND_SPEED: round(_wind_spd, 2),
-                ATTR_FORECAST_WIND_BEARING: self.day_data.wind_dir,
+                ATTR_ALERTS_CITY_NAME: alerts.city_name,
+                ATTR_ALERTS: [
+                    alert.as_attributes(descriptions)
+                    for alert in alerts.alerts.values()
+                ],
+                ATTR_ALERTS_MARKDOWN: self.alerts_coordinator.markdown,
+            }
+        if self.entity_description.is_forecast_item:
+            table = self.forecast_coordinator.table
+            index = self.entity_description.day_index
+            return {
+                **super().extra_state_attributes,
+                ATTR_FORECAST_TIME: table.utc_time[index],
+                ATTR_FORECAST_NATIVE_TEMP: table.temp[index],
+                ATTR_FORECAST_NATIVE_TEMP_LOW: table.temp_low[index],
+                ATTR_FORECAST_NATIVE_PRECIPITATION: table.precip[index],
+                ATTR_FORECAST_PRECIPITATION_PROBABILITY: table.pop[index],
+                ATTR_FORECAST_SNOW: table.snow[index],
+                ATTR_FORECAST_CLOUDINESS: table.clouds[index],
+                ATTR_FORECAST_WEATHER_TEXT: table.weather_text[index],
+                ATTR_FORECAST_NATIVE_WIND_SPEED: table.wind_spd[index],
+                ATTR_FORECAST_WIND_BEARING: table.wind_dir[index],
+            }
+        if self.entity_description.hour_offset is not None:
+            table = self.hourly_coordinator.data
+            index = self._hour_index()
+            is_metric = self.hass.config.units is METRIC_SYSTEM
+            return {
+                **super().extra_state_attributes,
+                ATTR_FORECAST_TIME: table.time_at(index),
+                ATTR_FORECAST_NATIVE_TEMP: table.native_value("temp", index, is_metric),
+                ATTR_FORECAST_HUMIDITY: table.value("humidity", index),
+                ATTR_FORECAST_NATIVE_PRECIPITATION: table.native_value(
+                    "precip", index, is_metric
+                ),
+                ATTR_FORECAST_PRECIPITATION_PROBABILITY: table.value("pop", index),
+                ATTR_FORECAST_SNOW: table.native_value("snow", index, is_metric),
+                ATTR_FORECAST_CLOUDINESS: table.value("clouds", index),
+                ATTR_FORECAST_WEATHER_TEXT: table.weather_text[index],
+                ATTR_FORECAST_NATIVE_WIND_SPEED: table.native_value(
+                    "wind_spd", index, is_metric
+                ),
+                ATTR_FORECAST_WIND_BEARING: table.value("wind_dir", index),
             }
         if self.entity_description.key == _KEY_AQI:
             return {
                 **super().extra_state_attributes,
                 ATTR_AQI_LEVEL: getattr(self.coordinator.data, "aqi_level"),
             }
+        if self.entity_description.key == _KEY_API_CALLS_TODAY:
+            return {
+                **super().extra_state_attributes,
+                **self.weatherbitapi.stats.calls_today,
+            }
+        if self.entity_description.key == _KEY_API_FAILURES:
+            return {
+                **super().extra_state_attributes,
+                **self.weatherbitapi.stats.failures,
+            }
+        if self.entity_description.key == _KEY_ENTITY_UPDATE_TIME:
+            return {
+                **super().extra_state_attributes,
+                "state_writes": self.entry_stats.state_writes,
+                "state_writes_suppressed": self.entry_stats.state_writes_suppressed,
+            }
+        if self.entity_description.key == _KEY_REPEATED_OBSERVATIONS:
+            return {
+                **super().extra_state_attributes,
+                "new_observations": self.weatherbitapi.stats.observations_new,
+            }
+        if self.interpolator is not None:
+            return {
+                **super().extra_state_attributes,
+                ATTR_ESTIMATED: self._estimated_value() is not None,
+                ATTR_OBSERVED_VALUE: getattr(
+                    self.coordinator.data, self.entity_description.key, None
+                ),
+            }
         return super().extra_state_attributes
+
+    def _state_fingerprint(self):
+        """Return the data the sensor shows, which compares equal when nothing changed.
+
+        Only the diagnostic sensors, whose state is cheap to compute, use the
+        written state itself.
+        """
+        description = self.entity_description
+        if description.is_diagnostic:
+            return super()._state_fingerprint()
+        if description.is_forecast_item:
+            return (self.available, self.forecast_coordinator.table)
+        if description.hour_offset is not None:
+            return (self._hour_index(), self.hourly_coordinator.data)
+        if description.data_source == DATA_SOURCE_ALERTS:
+            return (
+                self.alerts_coordinator.data,
+                self.entry.options.get(
+                    CONF_ALERT_DESCRIPTIONS, DEFAULT_ALERT_DESCRIPTIONS
+                ),
+            )
+        data = self.coordinator.data
+        return (
+            self.available,
+            getattr(data, description.key, None),
+            getattr(data, "aqi_level", None) if description.key == _KEY_AQI else None,
+            self._estimated_value(),
+        )
+
+    def _hour_index(self) -> int | None:
+        """Return the row of the hourly forecast the sensor shows."""
+        if self.hourly_coordinator is None or self.hourly_coordinator.data is None:
+            return None
+        return self.hourly_coordinator.data.index_at(
+            dt_util.utcnow() + timedelta(hours=self.entity_description.hour_offset)
+        )
+
+    def _estimated_value(self) -> StateType:
+        """Return the value estimated from the hourly forecast, if any."""
+        if self.interpolator is None:
+            return None
+        return self.interpolator.values.get(self.entity_description.key)
+
+    def _diagnostic_value(self) -> StateType:
+        """Return the state of a diagnostic sensor."""
+        stats = self.weatherbitapi.stats
+        key = self.entity_description.key
+        if key == _KEY_API_CALLS_TODAY:
+            return sum(stats.calls_today.values())
+        if key == _KEY_API_CALLS_REMAINING:
+            return self.weatherbitapi.key_client.scheduler.remaining_calls
+        if key == _KEY_API_FAILURES:
+            return sum(stats.failures.values())
+        if key == _KEY_CACHE_HIT_RATIO:
+            ratio = stats.cache_hit_ratio
+            return None if ratio is None else round(ratio * 100, 1)
+        if key == _KEY_ENTITY_UPDATE_TIME:
+            return round(self.entry_stats.compute_time * 1000, 1)
+        if key == _KEY_REPEATED_OBSERVATIONS:
+            return stats.observations_repeated
+
+        latency = {
+            _KEY_API_LATENCY_P50: stats.latency(50),
+            _KEY_API_LATENCY_P95: stats.latency(95),
+            _KEY_API_LATENCY_MAX: max(stats.latencies, default=None),
+        }[key]
+        return None if latency is None else round(latency * 1000, 1)
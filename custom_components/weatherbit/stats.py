@@ -0,0 +1,135 @@
+"""Request statistics for the Weatherbit integration."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from datetime import date
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+import homeassistant.util.dt as dt_util
+
+LATENCY_SAMPLES = 200
+
+
+class WeatherBitApiStats:
+    """Calls, latency, failures, cache use and fresh data of one entry.
+
+    The call counters start over at midnight UTC, when Weatherbit resets the
+    quota, and are restored from the entry's store after a restart. Latency is
+    kept for the last LATENCY_SAMPLES requests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self._day: date = dt_util.utcnow().date()
+        self._calls_today: Counter[str] = Counter()
+        self.calls_total = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.failures: Counter[str] = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.requests_shared = 0
+        self.observations_new = 0
+        self.observations_repeated = 0
+        self._listeners: dict[CALLBACK_TYPE, CALLBACK_TYPE] = {}
+
+    @property
+    def calls_today(self) -> Counter[str]:
+        """Return the calls made today per endpoint."""
+        self._async_roll_day()
+        return self._calls_today
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of data lookups answered without a request."""
+        lookups = self.cache_hits + self.cache_misses
+        if not lookups:
+            return None
+        return self.cache_hits / lookups
+
+    def latency(self, percentile: float) -> float | None:
+        """Return a latency percentile in seconds, using the nearest rank."""
+        if not self.latencies:
+            return None
+        samples = sorted(self.latencies)
+        rank = max(round(percentile / 100 * len(samples)) - 1, 0)
+        return samples[min(rank, len(samples) - 1)]
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for counted calls."""
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.pop(remove_listener)
+
+        self._listeners[remove_listener] = update_callback
+        return remove_listener
+
+    @callback
+    def async_restore_calls(self, day: date | None, calls: dict[str, int]) -> None:
+        """Add the calls per endpoint saved on a day, if that day is today."""
+        self._async_roll_day()
+        if day == self._day:
+            self._calls_today.update(calls)
+
+    @callback
+    def async_record_request(self, endpoint: str, seconds: float) -> None:
+        """Count a request to an endpoint and its duration."""
+        self._async_roll_day()
+        self._calls_today[endpoint] += 1
+        self.calls_total += 1
+        self.latencies.append(seconds)
+        for update_callback in list(self._listeners.values()):
+            update_callback()
+
+    @callback
+    def async_record_failure(self, err: BaseException) -> None:
+        """Count a failed update by the type of its error."""
+        self.failures[type(err).__name__] += 1
+
+    @callback
+    def async_record_cache(self, hit: bool) -> None:
+        """Count a data lookup that was or was not answered from a cache."""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    @callback
+    def async_record_shared(self) -> None:
+        """Count an update answered by a request already in flight."""
+        self.requests_shared += 1
+
+    @callback
+    def async_record_observation(self, new: bool) -> None:
+        """Count a fetched observation that was or was not new."""
+        if new:
+            self.observations_new += 1
+        else:
+            self.observations_repeated += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "calls_today": dict(self.calls_today),
+            "calls_total": self.calls_total,
+            "latency_p50": self.latency(50),
+            "latency_p95": self.latency(95),
+            "latency_max": max(self.latencies, default=None),
+            "latency_samples": len(self.latencies),
+            "failures": dict(self.failures),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "requests_shared": self.requests_shared,
+            "observations_new": self.observations_new,
+            "observations_repeated": self.observations_repeated,
+        }
+
+    @callback
+    def _async_roll_day(self) -> None:
+        """Start counting calls from zero on a new UTC day."""
+        if (today := dt_util.utcnow().date()) != self._day:
+            self._day = today
+            self._calls_today.clear()
@@ -0,0 +1,193 @@
+"""Persistent storage of the last Weatherbit responses."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+from pyweatherbitdata.data import (
+    BaseDataDescription,
+    ForecastDescription,
+    ForecastDetailDescription,
+    ObservationDescription,
+)
+
+from .alerts import WeatherBitAlerts
+from .const import (
+    COORDINATOR_ALERTS,
+    COORDINATOR_FORECAST,
+    COORDINATOR_HOURLY,
+    COORDINATOR_SENSORS,
+    DOMAIN,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .forecast import WeatherBitHourlyForecast
+
+_KEY_CALLS = "calls_today"
+_KEY_DATE = "date"
+_KEY_ENDPOINTS = "endpoints"
+_KEY_FETCHED = "fetched"
+_KEY_DATA = "data"
+_KEY_STATION = "station"
+_KEY_IS_NIGHT = "is_night"
+_KEY_LANGUAGE = "language"
+_KEY_UNITS = "units"
+
+_OBSERVATION_DATETIMES = ("utc_time", "observation_time")
+
+
+def _observation_from_dict(data: dict[str, Any]) -> ObservationDescription:
+    """Rebuild an observation from its stored form."""
+    observation = ObservationDescription(**data)
+    for field in _OBSERVATION_DATETIMES:
+        if isinstance(value := getattr(observation, field), str):
+            setattr(observation, field, dt_util.parse_datetime(value))
+    return observation
+
+
+def _forecast_from_dict(data: dict[str, Any]) -> ForecastDescription:
+    """Rebuild a forecast from its stored form."""
+    days = data.pop("forecast", [])
+    forecast = ForecastDescription(**data)
+    forecast.forecast = [ForecastDetailDescription(**day) for day in days]
+    return forecast
+
+
+_LOADERS = {
+    COORDINATOR_ALERTS: WeatherBitAlerts.from_dict,
+    COORDINATOR_SENSORS: _observation_from_dict,
+    COORDINATOR_FORECAST: _forecast_from_dict,
+    COORDINATOR_HOURLY: WeatherBitHourlyForecast.from_dict,
+}
+_DUMPERS = {
+    COORDINATOR_ALERTS: WeatherBitAlerts.as_dict,
+    COORDINATOR_HOURLY: WeatherBitHourlyForecast.as_dict,
+}
+
+
+class WeatherBitDataStore:
+    """Keep the last observations, forecasts and station data of an entry on disk."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored data."""
+        self._data = await self._store.async_load() or {}
+
+    async def async_flush(self) -> None:
+        """Write pending changes to disk now."""
+        await self._store.async_save(self._data)
+
+    async def async_remove(self) -> None:
+        """Remove the stored data."""
+        self._data = {}
+        await self._store.async_remove()
+
+    @callback
+    def async_get(
+        self, kind: str, max_age: timedelta, units: str, language: str
+    ) -> Any | None:
+        """Return stored data of a kind if it was fetched less than max_age ago.
+
+        Data fetched in other units or another language is not returned.
+        """
+        if (item := self._fresh_item(kind, max_age)) is None:
+            return None
+        if item.get(_KEY_UNITS) != units or item.get(_KEY_LANGUAGE) != language:
+            return None
+        return self._load(kind, item)
+
+    @callback
+    def async_get_last(self, kind: str) -> Any | None:
+        """Return the stored data of a kind, however old it is."""
+        if (item := self._data.get(kind)) is None:
+            return None
+        return self._load(kind, item)
+
+    @callback
+    def async_get_age(self, kind: str) -> timedelta | None:
+        """Return how long ago the stored data of a kind was fetched."""
+        if (item := self._data.get(kind)) is None:
+            return None
+        return dt_util.utcnow() - dt_util.parse_datetime(item[_KEY_FETCHED])
+
+    @callback
+    def async_set(self, kind: str, data: Any, units: str, language: str) -> None:
+        """Store data of a kind fetched just now in units and language."""
+        self._data[kind] = {
+            _KEY_FETCHED: dt_util.utcnow().isoformat(),
+            _KEY_UNITS: units,
+            _KEY_LANGUAGE: language,
+            _KEY_DATA: _DUMPERS.get(kind, asdict)(data),
+        }
+        self._async_schedule_save()
+
+    @callback
+    def async_get_is_night(self) -> bool:
+        """Return the night flag saved with the last station data."""
+        return self._data.get(_KEY_STATION, {}).get(_KEY_IS_NIGHT, False)
+
+    @callback
+    def async_get_station_age(self) -> timedelta | None:
+        """Return how long ago the station data was fetched."""
+        return self.async_get_age(_KEY_STATION)
+
+    @callback
+    def async_set_station(self, station_data: BaseDataDescription, is_night: bool) -> None:
+        """Store station data fetched just now."""
+        self._data[_KEY_STATION] = {
+            _KEY_FETCHED: dt_util.utcnow().isoformat(),
+            _KEY_DATA: asdict(station_data),
+            _KEY_IS_NIGHT: is_night,
+        }
+        self._async_schedule_save()
+
+    @callback
+    def async_get_calls(self) -> tuple[date | None, dict[str, int]]:
+        """Return the UTC day and the calls per endpoint saved for it."""
+        calls = self._data.get(_KEY_CALLS, {})
+        try:
+            day = date.fromisoformat(calls[_KEY_DATE])
+        except (KeyError, TypeError, ValueError):
+            return None, {}
+        return day, dict(calls.get(_KEY_ENDPOINTS, {}))
+
+    @callback
+    def async_set_calls(self, calls: dict[str, int]) -> None:
+        """Store the calls per endpoint made today."""
+        self._data[_KEY_CALLS] = {
+            _KEY_DATE: dt_util.utcnow().date().isoformat(),
+            _KEY_ENDPOINTS: dict(calls),
+        }
+        self._async_schedule_save()
+
+    def _load(self, kind: str, item: dict[str, Any]) -> Any | None:
+        """Rebuild the data of a stored item."""
+        try:
+            return _LOADERS[kind](dict(item[_KEY_DATA]))
+        except (KeyError, TypeError, ValueError):
+            # Stored by an older version in another form.
+            return None
+
+    def _fresh_item(self, kind: str, max_age: timedelta) -> dict[str, Any] | None:
+        """Return the stored item of a kind if it is younger than max_age."""
+        if (item := self._data.get(kind)) is None:
+            return None
+        fetched: datetime | None = dt_util.parse_datetime(item[_KEY_FETCHED])
+        if fetched is None or dt_util.utcnow() - fetched >= max_age:
+            return None
+        return item
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the data after a short delay."""
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
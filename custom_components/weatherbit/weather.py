@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 
 from homeassistant.components.weather import (
     ATTR_FORECAST_CONDITION,
@@ -15,6 +16,7 @@ from homeassistant.components.weather import (
     Forecast,
     WeatherEntity,
     WeatherEntityDescription,
+    WeatherEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -22,17 +24,26 @@ from homeassistant.const import (
     UnitOfLength,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
-from pyweatherbitdata.data import ForecastDetailDescription
+from homeassistant.core import HomeAssistant, callback
+from pyweatherbitdata.data import ForecastDescription, ForecastDetailDescription
 
-from .const import ATTR_ALT_CONDITION, DOMAIN
+from .const import ATTR_ALT_CONDITION, DATA_SOURCE_BOTH, DOMAIN
 from .entity import WeatherbitEntity
+from .forecast import WeatherBitHourlyForecast
 from .models import WeatherBitEntryData
 
 _WEATHER_DAILY = "weather_daily"
 
-WEATHER_TYPES: tuple[WeatherEntityDescription, ...] = (
-    WeatherEntityDescription(
+
+@dataclass(frozen=True, kw_only=True)
+class WeatherBitWeatherEntityDescription(WeatherEntityDescription):
+    """Describes WeatherBit Weather entity."""
+
+    data_source: str = DATA_SOURCE_BOTH
+
+
+WEATHER_TYPES: tuple[WeatherBitWeatherEntityDescription, ...] = (
+    WeatherBitWeatherEntityDescription(
         key=_WEATHER_DAILY,
         name="Weatherbit",
     ),
@@ -49,6 +60,7 @@ async def async_setup_entry(
     weatherbitapi = entry_data.weatherbitapi
     coordinator = entry_data.coordinator
     forecast_coordinator = entry_data.forecast_coordinator
+    hourly_coordinator = entry_data.hourly_coordinator
     station_data = entry_data.station_data
 
     entities = []
@@ -61,6 +73,7 @@ async def async_setup_entry(
                 station_data,
                 description,
                 entry,
+                hourly_coordinator,
             )
         )
 
@@ -87,6 +100,7 @@ class WeatherbitWeatherEntity(WeatherbitEntity, WeatherEntity):
         station_data,
         description,
         entries: ConfigEntry,
+        hourly_coordinator=None,
     ):
         """Initialize an WeatherBit Weather Entity."""
         super().__init__(
@@ -97,16 +111,56 @@ class WeatherbitWeatherEntity(WeatherbitEntity, WeatherEntity):
             description,
             entries,
         )
-        self.daily_forecast = self.entity_description.key in _WEATHER_DAILY
         self._attr_name = self.entity_description.name
         self._attr_native_precipitation_unit = UnitOfLength.MILLIMETERS
         self._attr_precision = PRECISION_TENTHS
         self._attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+        self.hourly_coordinator = hourly_coordinator
+        self._attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
+        if hourly_coordinator is not None:
+            self._attr_supported_features |= WeatherEntityFeature.FORECAST_HOURLY
+        self._forecast_daily: list[Forecast] = []
+        self._forecast_daily_source: ForecastDescription | None = None
+        self._forecast_hourly: list[Forecast] = []
+        self._forecast_hourly_source: WeatherBitHourlyForecast | None = None
+
+    async def async_added_to_hass(self):
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.forecast_coordinator.async_add_listener(
+                self._handle_daily_forecast_update
+            )
+        )
+        if self.hourly_coordinator is not None:
+            self.async_on_remove(
+                self.hourly_coordinator.async_add_listener(
+                    self._handle_hourly_forecast_update
+                )
+            )
+
+    @callback
+    def _handle_daily_forecast_update(self) -> None:
+        """Push a new daily forecast to the subscribers."""
+        self.hass.async_create_task(self.async_update_listeners(("daily",)))
+
+    @callback
+    def _handle_hourly_forecast_update(self) -> None:
+        """Push a new hourly forecast to the subscribers."""
+        self.hass.async_create_task(self.async_update_listeners(("hourly",)))
+
+    def _state_fingerprint(self):
+        """Return the data objects, which compare equal when nothing changed."""
+        return (
+            self.available,
+            self.coordinator.data,
+            self.forecast_coordinator.data,
+        )
 
     @property
     def condition(self):
         """Return the current condition."""
-        return getattr(self.forecast_coordinator.data, "condition")
+        return getattr(self.forecast_coordinator.data, "condition", None)
 
     @property
     def native_temperature(self):
@@ -147,7 +201,7 @@ class WeatherbitWeatherEntity(WeatherbitEntity, WeatherEntity):
     @property
     def ozone(self):
         """Return the ozone."""
-        return getattr(self.forecast_coordinator.data, "ozone")
+        return getattr(self.forecast_coordinator.data, "ozone", None)
 
     @property
     def extra_state_attributes(self):
@@ -155,30 +209,67 @@ class WeatherbitWeatherEntity(WeatherbitEntity, WeatherEntity):
         return {
             **super().extra_state_attributes,
             ATTR_ALT_CONDITION: getattr(
-                self.forecast_coordinator.data, "alt_condition"
+                self.forecast_coordinator.data, "alt_condition", None
             ),
         }
 
-    @property
-    def forecast(self) -> list[Forecast] | None:
-        """Return the forecast array."""
-        data: list[Forecast] = []
-        if self.daily_forecast:
-            forecast_data: ForecastDetailDescription = (
-                self.forecast_coordinator.data.forecast
-            )
-            for item in forecast_data:
-                data.append(
-                    {
-                        ATTR_FORECAST_TIME: item.utc_time,
-                        ATTR_FORECAST_NATIVE_TEMP: item.max_temp,
-                        ATTR_FORECAST_NATIVE_TEMP_LOW: item.min_temp,
-                        ATTR_FORECAST_NATIVE_PRECIPITATION: item.precip,
-                        ATTR_FORECAST_PRECIPITATION_PROBABILITY: item.pop,
-                        ATTR_FORECAST_CONDITION: item.condition,
-                        ATTR_FORECAST_NATIVE_WIND_SPEED: item.wind_spd,
-                        ATTR_FORECAST_WIND_BEARING: item.wind_dir,
-                    }
-                )
-            return data
-        return data
+    async def async_forecast_daily(self) -> list[Forecast] | None:
+        """Return the daily forecast.
+
+        The list is built once per forecast update and shared by all readers.
+        """
+        data = self.forecast_coordinator.data
+        if data is not self._forecast_daily_source:
+            self._forecast_daily_source = data
+            self._forecast_daily = _build_forecast(data)
+        return self._forecast_daily
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast."""
+        if self.hourly_coordinator is None:
+            return None
+        data = self.hourly_coordinator.data
+        if data is not self._forecast_hourly_source:
+            self._forecast_hourly_source = data
+            self._forecast_hourly = _build_hourly_forecast(data)
+        return self._forecast_hourly
+
+
+def _build_forecast(data: ForecastDescription | None) -> list[Forecast]:
+    """Build the forecast array from the daily forecast data."""
+    if data is None:
+        return []
+
+    forecast_data: list[ForecastDetailDescription] = data.forecast
+    return [
+        {
+            ATTR_FORECAST_TIME: item.utc_time,
+            ATTR_FORECAST_NATIVE_TEMP: item.max_temp,
+            ATTR_FORECAST_NATIVE_TEMP_LOW: item.min_temp,
+            ATTR_FORECAST_NATIVE_PRECIPITATION: item.precip,
+            ATTR_FORECAST_PRECIPITATION_PROBABILITY: item.pop,
+            ATTR_FORECAST_CONDITION: item.condition,
+            ATTR_FORECAST_NATIVE_WIND_SPEED: item.wind_spd,
+            ATTR_FORECAST_WIND_BEARING: item.wind_dir,
+        }
+        for item in forecast_data
+    ]
+
+
+def _build_hourly_forecast(data: WeatherBitHourlyForecast | None) -> list[Forecast]:
+    """Build the forecast array from the columns of the hourly forecast."""
+    if data is None:
+        return []
+
+    return [
+        {
+            ATTR_FORECAST_TIME: data.time_at(index),
+            ATTR_FORECAST_NATIVE_TEMP: data.value("temp", index),
+            ATTR_FORECAST_NATIVE_PRECIPITATION: data.value("precip", index),
+            ATTR_FORECAST_PRECIPITATION_PROBABILITY: data.value("pop", index),
+            ATTR_FORECAST_CONDITION: data.condition[index],
+            ATTR_FORECAST_NATIVE_WIND_SPEED: data.value("wind_spd", index),
+            ATTR_FORECAST_WIND_BEARING: data.value("wind_dir", index),
+        }
+        for index in range(len(data))
+    ]
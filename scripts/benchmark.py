@@ -0,0 +1,366 @@
+"""Benchmark the Weatherbit integration against the local stub server.
+
+Boots a minimal Home Assistant core in a temporary config directory, starts
+stub_server.py in its own process and measures:
+
+- wall time of setting up 1, 10 and 100 config entries,
+- CPU time of one refresh of the observation and forecast coordinators,
+- the cost of the sensor attributes and the weather forecast,
+- the number of entity state writes per coordinator refresh.
+
+The stub runs in a separate process, so its CPU time is not counted. The
+results are written as JSON, and can be compared with an earlier run to find
+regressions between releases.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import platform
+from statistics import mean, median
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+# pylint: disable=wrong-import-position
+from homeassistant import config_entries, loader  # noqa: E402
+from homeassistant.const import (  # noqa: E402
+    CONF_API_KEY,
+    CONF_ID,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    __version__ as HA_VERSION,
+)
+from homeassistant.core import CoreState, HomeAssistant  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    issue_registry as ir,
+)
+from homeassistant.helpers.entity import Entity  # noqa: E402
+from homeassistant.util.unit_system import METRIC_SYSTEM  # noqa: E402
+
+from custom_components.weatherbit.const import (  # noqa: E402
+    CONF_BASE_URL,
+    CONF_DAILY_CALL_BUDGET,
+    CONF_FORECAST_LANGUAGE,
+    CONF_HOURLY_FORECAST,
+    CONF_INTERVAL_FORECAST,
+    CONF_INTERVAL_SENSORS,
+    DOMAIN,
+)
+from custom_components.weatherbit.models import WeatherBitEntryData  # noqa: E402
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTRY_COUNTS = (1, 10, 100)
+STUB_PORT = 8766
+
+
+class WriteCounter:
+    """Count the calls of Entity.async_write_ha_state."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.count = 0
+        self._original = Entity.async_write_ha_state
+
+    def __enter__(self) -> WriteCounter:
+        """Start counting."""
+        counter = self
+        original = self._original
+
+        def async_write_ha_state(self: Entity) -> None:
+            counter.count += 1
+            original(self)
+
+        self._patch = patch.object(Entity, "async_write_ha_state", async_write_ha_state)
+        self._patch.start()
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        """Stop counting."""
+        self._patch.stop()
+
+
+@asynccontextmanager
+async def stub_server(port: int):
+    """Run the stub server in its own process."""
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(REPO / "scripts" / "stub_server.py"),
+            "--port",
+            str(port),
+            "--no-fixtures",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        async with ClientSession() as session:
+            for _attempt in range(100):
+                try:
+                    async with session.get(f"{base_url}/stats"):
+                        break
+                except OSError:
+                    await asyncio.sleep(0.05)
+            else:
+                raise RuntimeError("The stub server did not start")
+        yield f"{base_url}/v2.0"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Return a minimal running Home Assistant instance."""
+    hass = HomeAssistant(config_dir)
+    hass.config.location_name = "Benchmark"
+    hass.config.latitude = 55.6
+    hass.config.longitude = 12.5
+    hass.config.set_time_zone("UTC")
+    hass.config.units = METRIC_SYSTEM
+    hass.config.skip_pip = True
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    entity.async_setup(hass)
+    loader.async_setup(hass)
+    await asyncio.gather(
+        ar.async_load(hass),
+        dr.async_load(hass),
+        er.async_load(hass),
+        ir.async_load(hass),
+    )
+    await hass.config_entries.async_initialize()
+    hass.state = CoreState.running
+    return hass
+
+
+def make_entry(index: int, base_url: str) -> config_entries.ConfigEntry:
+    """Return a config entry for a location on a 0.5 degree grid."""
+    latitude = 40.0 + (index // 20) * 0.5
+    longitude = (index % 20) * 0.5
+    return config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"Location {index}",
+        data={
+            CONF_ID: f"Location {index}",
+            CONF_API_KEY: "benchmark",
+            CONF_LATITUDE: latitude,
+            CONF_LONGITUDE: longitude,
+            CONF_BASE_URL: base_url,
+        },
+        options={
+            CONF_INTERVAL_SENSORS: 60,
+            CONF_INTERVAL_FORECAST: 60,
+            CONF_FORECAST_LANGUAGE: "en",
+            CONF_DAILY_CALL_BUDGET: 100000,
+            CONF_HOURLY_FORECAST: True,
+        },
+        source=config_entries.SOURCE_USER,
+        unique_id=f"benchmark_{index}",
+    )
+
+
+def timed(func: Callable[[], Any], rounds: int) -> dict[str, float]:
+    """Return the time in microseconds of calling a function."""
+    samples = []
+    for _round in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return summary(samples)
+
+
+def summary(samples: list[float]) -> dict[str, float]:
+    """Return the mean, median, min and max of samples."""
+    return {
+        "mean": round(mean(samples), 3),
+        "median": round(median(samples), 3),
+        "min": round(min(samples), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+async def bench_setup(base_url: str, count: int) -> dict[str, Any]:
+    """Measure setting up a number of entries in a fresh instance."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entries = [make_entry(index, base_url) for index in range(count)]
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        for entry in entries:
+            await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        wall = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+
+        loaded = sum(
+            entry.state is config_entries.ConfigEntryState.LOADED for entry in entries
+        )
+        result = {
+            "entries": count,
+            "loaded": loaded,
+            "wall_s": round(wall, 4),
+            "cpu_s": round(cpu, 4),
+            "wall_per_entry_ms": round(wall / count * 1000, 3),
+            "entities": len(hass.states.async_all()),
+        }
+        await hass.async_stop(force=True)
+    return result
+
+
+async def bench_refresh(base_url: str, rounds: int) -> dict[str, Any]:
+    """Measure coordinator refreshes, entity attributes and state writes."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entry = make_entry(0, base_url)
+        await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        entry_data: WeatherBitEntryData = hass.data[DOMAIN][entry.entry_id]
+
+        results: dict[str, Any] = {}
+        coordinators = {
+            "sensors": entry_data.coordinator,
+            "forecast": entry_data.forecast_coordinator,
+            "hourly": entry_data.hourly_coordinator,
+        }
+        for name, coordinator in coordinators.items():
+            if coordinator is None:
+                continue
+            cpu_samples = []
+            with WriteCounter() as writes:
+                for _round in range(rounds):
+                    start = time.process_time()
+                    await coordinator.async_refresh()
+                    await hass.async_block_till_done()
+                    cpu_samples.append((time.process_time() - start) * 1e3)
+            results[f"refresh_{name}"] = {
+                "cpu_ms": summary(cpu_samples),
+                "state_writes_per_refresh": round(writes.count / rounds, 2),
+                "listeners": len(coordinator._listeners),  # pylint: disable=protected-access
+            }
+
+        sensors = [
+            ent
+            for ent in hass.data["sensor"].entities
+            if ent.platform.config_entry is entry
+        ]
+        results["sensor_extra_state_attributes_us"] = {
+            "entities": len(sensors),
+            **timed(
+                lambda: [sensor.extra_state_attributes for sensor in sensors], rounds
+            ),
+        }
+
+        weather = next(iter(hass.data["weather"].entities))
+        daily = []
+        hourly = []
+        for _round in range(rounds):
+            start = time.perf_counter()
+            await weather.async_forecast_daily()
+            daily.append((time.perf_counter() - start) * 1e6)
+            start = time.perf_counter()
+            await weather.async_forecast_hourly()
+            hourly.append((time.perf_counter() - start) * 1e6)
+        results["weather_forecast_daily_us"] = summary(daily)
+        results["weather_forecast_hourly_us"] = summary(hourly)
+        results["weather_state_attributes_us"] = timed(
+            lambda: weather.state_attributes, rounds
+        )
+
+        await hass.async_stop(force=True)
+    return results
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any], path: str = "") -> None:
+    """Log the relative change of every number against an earlier run."""
+    for key, value in current.items():
+        name = f"{path}.{key}" if path else key
+        old = previous.get(key) if isinstance(previous, dict) else None
+        if key == "setup":
+            value = {str(item["entries"]): item for item in value}
+            old = {str(item["entries"]): item for item in old or []}
+        if isinstance(value, dict):
+            compare(value, old or {}, name)
+        elif isinstance(value, int | float) and isinstance(old, int | float) and old:
+            change = (value - old) / old * 100
+            _LOGGER.info("%-60s %12s -> %12s (%+.1f%%)", name, old, value, change)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run all benchmarks."""
+    async with stub_server(args.port) as base_url:
+        setup = []
+        for count in args.entries:
+            _LOGGER.info("Setting up %s entries", count)
+            setup.append(await bench_setup(base_url, count))
+        _LOGGER.info("Measuring refreshes")
+        refresh = await bench_refresh(base_url, args.rounds)
+
+    manifest = json.loads(
+        (REPO / "custom_components" / DOMAIN / "manifest.json").read_text()
+    )
+    return {
+        "integration_version": manifest["version"],
+        "homeassistant_version": HA_VERSION,
+        "python_version": platform.python_version(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "rounds": args.rounds,
+        "setup": setup,
+        **refresh,
+    }
+
+
+def main() -> None:
+    """Run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries",
+        type=int,
+        nargs="+",
+        default=list(ENTRY_COUNTS),
+        help="numbers of entries to set up (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=100, help="repetitions of each measurement"
+    )
+    parser.add_argument("--port", type=int, default=STUB_PORT)
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    parser.add_argument(
+        "--compare", type=Path, help="earlier results to compare against"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("homeassistant").setLevel(logging.ERROR)
+    logging.getLogger("custom_components").setLevel(logging.ERROR)
+
+    results = asyncio.run(run(args))
+    args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    _LOGGER.info("Results written to %s", args.output)
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
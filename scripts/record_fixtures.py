@@ -0,0 +1,78 @@
+"""Record real Weatherbit responses as fixtures for the stub server.
+
+Every endpoint recorded uses one call of the daily quota. The API key is
+read from the WEATHERBIT_API_KEY environment variable unless given, and is
+never written to the fixtures.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+
+from aiohttp import ClientSession, ClientTimeout
+
+from stub_server import DEFAULT_FIXTURES, ENDPOINTS
+
+_LOGGER = logging.getLogger(__name__)
+
+BASE_URL = "https://api.weatherbit.io/v2.0"
+
+
+async def record(args: argparse.Namespace) -> int:
+    """Fetch the selected endpoints and save each response."""
+    args.output.mkdir(parents=True, exist_ok=True)
+    query = {
+        "lat": args.latitude,
+        "lon": args.longitude,
+        "key": args.api_key,
+        "lang": args.language,
+        "units": "M",
+    }
+    failed = 0
+    async with ClientSession(timeout=ClientTimeout(total=30)) as session:
+        for path in args.endpoints:
+            params = dict(query)
+            if path == "forecast/hourly":
+                params["hours"] = args.hours
+            async with session.get(f"{BASE_URL}/{path}", params=params) as resp:
+                if resp.status != 200:
+                    _LOGGER.error("%s: HTTP %s", path, resp.status)
+                    failed += 1
+                    continue
+                data = await resp.json()
+            fixture = args.output / f"{ENDPOINTS[path]}.json"
+            fixture.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            _LOGGER.info("%s: saved %s", path, fixture)
+    return failed
+
+
+def main() -> None:
+    """Record the fixtures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--api-key", default=os.environ.get("WEATHERBIT_API_KEY"))
+    parser.add_argument("--latitude", type=float, required=True)
+    parser.add_argument("--longitude", type=float, required=True)
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--hours", type=int, default=48)
+    parser.add_argument(
+        "--endpoints",
+        nargs="+",
+        choices=list(ENDPOINTS),
+        default=["current", "forecast/daily", "alerts"],
+        help="endpoints to record, forecast/hourly needs a paid plan",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_FIXTURES)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if not args.api_key:
+        parser.error("an API key is needed, use --api-key or WEATHERBIT_API_KEY")
+    sys.exit(1 if asyncio.run(record(args)) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""Local stand-in for the Weatherbit API.
+
+Serves the current, forecast/daily, forecast/hourly and alerts endpoints, so
+the integration can be run and load tested without using the daily quota.
+Responses are replayed from fixture files recorded with record_fixtures.py,
+or generated when no fixture exists. Latency, server errors, rate limiting
+and invalid keys can be simulated.
+
+Point a location at the server by entering http://HOST:PORT/v2.0 as the API
+address when adding it (advanced mode), and use any API key.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import json
+import logging
+from pathlib import Path
+import random
+from typing import Any
+
+from aiohttp import web
+
+UTC = timezone.utc
+
+_LOGGER = logging.getLogger(__name__)
+
+API_PREFIX = "/v2.0"
+DEFAULT_FIXTURES = Path(__file__).parent / "fixtures"
+DEFAULT_PORT = 8765
+
+ENDPOINTS = {
+    "current": "current",
+    "forecast/daily": "forecast_daily",
+    "forecast/hourly": "forecast_hourly",
+    "alerts": "alerts",
+}
+
+
+@dataclass
+class StubOptions:
+    """Behaviour of the stub server."""
+
+    fixtures: Path | None = DEFAULT_FIXTURES
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    daily_limit: int | None = None
+    invalid_keys: set[str] = field(default_factory=set)
+    alerts: int = 0
+    seed: int | None = None
+
+
+@dataclass
+class StubStats:
+    """Requests seen by the stub server."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    responses: Counter[int] = field(default_factory=Counter)
+    calls_per_key: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as JSON serializable data."""
+        return {
+            "requests": dict(self.requests),
+            "responses": {str(status): count for status, count in self.responses.items()},
+            "calls_per_key": {
+                f"...{key[-4:]}": count for key, count in self.calls_per_key.items()
+            },
+            "total": sum(self.requests.values()),
+        }
+
+
+class WeatherbitStub:
+    """The request handlers and state of the stub server."""
+
+    def __init__(self, options: StubOptions) -> None:
+        """Initialize the stub."""
+        self.options = options
+        self.stats = StubStats()
+        self._random = random.Random(options.seed)
+
+    def create_app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        for path, name in ENDPOINTS.items():
+            app.router.add_get(f"{API_PREFIX}/{path}", self._handler(name))
+        app.router.add_get("/stats", self._handle_stats)
+        app.router.add_post("/stats/reset", self._handle_reset)
+        return app
+
+    def _handler(self, name: str):
+        """Return the request handler of an endpoint."""
+
+        async def _handle(request: web.Request) -> web.Response:
+            return await self._handle_endpoint(name, request)
+
+        return _handle
+
+    async def _handle_endpoint(self, name: str, request: web.Request) -> web.Response:
+        """Answer a request, or fail it the way the real API would."""
+        options = self.options
+        key = request.query.get("key", "")
+        self.stats.requests[name] += 1
+
+        if options.latency or options.jitter:
+            await asyncio.sleep(
+                (options.latency + self._random.uniform(0, options.jitter)) / 1000
+            )
+
+        if not key or key in options.invalid_keys:
+            return self._respond(
+                403, {"error": "API key not valid, or not yet activated."}
+            )
+
+        self.stats.calls_per_key[key] += 1
+        if (
+            options.daily_limit is not None
+            and self.stats.calls_per_key[key] > options.daily_limit
+        ):
+            return self._respond(
+                429,
+                {
+                    "status_code": 429,
+                    "status_message": (
+                        f"Your request count ({self.stats.calls_per_key[key]}) is over"
+                        f" the allowed limit of {options.daily_limit} per day"
+                    ),
+                },
+            )
+
+        if options.error_rate and self._random.random() < options.error_rate:
+            return self._respond(500, {"error": "Internal server error."})
+
+        return self._respond(200, self._payload(name, request.query))
+
+    def _respond(self, status: int, payload: dict[str, Any]) -> web.Response:
+        """Return a JSON response and count it."""
+        self.stats.responses[status] += 1
+        return web.json_response(payload, status=status)
+
+    def _payload(self, name: str, query: Any) -> dict[str, Any]:
+        """Return the recorded response of an endpoint, or a generated one."""
+        if self.options.fixtures is not None:
+            fixture = self.options.fixtures / f"{name}.json"
+            if fixture.is_file():
+                return json.loads(fixture.read_text(encoding="utf-8"))
+
+        latitude = float(query.get("lat", 55.0))
+        longitude = float(query.get("lon", 12.0))
+        now = datetime.now(UTC)
+        if name == "current":
+            return generate_current(latitude, longitude, now)
+        if name == "forecast_daily":
+            return generate_daily(latitude, longitude, now, int(query.get("days", 16)))
+        if name == "forecast_hourly":
+            return generate_hourly(latitude, longitude, now, int(query.get("hours", 48)))
+        return generate_alerts(latitude, longitude, now, self.options.alerts)
+
+    async def _handle_stats(self, _request: web.Request) -> web.Response:
+        """Return the request statistics."""
+        return web.json_response(self.stats.as_dict())
+
+    async def _handle_reset(self, _request: web.Request) -> web.Response:
+        """Reset the statistics, which also starts a new quota day."""
+        self.stats = StubStats()
+        return web.json_response({})
+
+
+def _weather(code: int) -> dict[str, Any]:
+    """Return the weather block of a response."""
+    descriptions = {800: "Clear sky", 802: "Scattered clouds", 500: "Light rain"}
+    return {
+        "icon": "c02d",
+        "code": code,
+        "description": descriptions.get(code, "Overcast clouds"),
+    }
+
+
+def generate_current(
+    latitude: float, longitude: float, now: datetime
+) -> dict[str, Any]:
+    """Return a current observation for the last ten minute mark."""
+    observed = now.replace(minute=now.minute - now.minute % 10, second=0, microsecond=0)
+    return {
+        "count": 1,
+        "data": [
+            {
+                "station": "STUB1",
+                "country_code": "DK",
+                "state_code": "17",
+                "city_name": "Stubby",
+                "timezone": "Europe/Copenhagen",
+                "lat": latitude,
+                "lon": longitude,
+                "pod": "d" if 6 <= now.hour < 18 else "n",
+                "ts": int(observed.timestamp()),
+                "ob_time": observed.strftime("%Y-%m-%d %H:%M"),
+                "datetime": observed.strftime("%Y-%m-%d:%H"),
+                "temp": 10.0 + observed.minute / 10,
+                "app_temp": 8.5,
+                "rh": 75,
+                "pres": 1008.0,
+                "slp": 1012.0,
+                "clouds": 40,
+                "solar_rad": 120.0,
+                "wind_spd": 4.2,
+                "wind_cdir": "SW",
+                "wind_dir": 225,
+                "dewpt": 6.0,
+                "weather": _weather(802),
+                "vis": 16.0,
+                "precip": 0.0,
+                "snow": 0.0,
+                "uv": 2.0,
+                "aqi": 25,
+                "dhi": 50,
+                "dni": 300,
+                "ghi": 200,
+                "elev_angle": 20.0,
+                "h_angle": 0.0,
+                "sunrise": "06:30",
+                "sunset": "17:30",
+            }
+        ],
+    }
+
+
+def generate_daily(
+    latitude: float, longitude: float, now: datetime, days: int
+) -> dict[str, Any]:
+    """Return a daily forecast starting today."""
+    data = []
+    for day in range(days):
+        date = (now + timedelta(days=day)).date()
+        data.append(
+            {
+                "valid_date": date.isoformat(),
+                "ts": int(datetime.combine(date, datetime.min.time(), UTC).timestamp()),
+                "temp": 10.0 + day % 5,
+                "max_temp": 14.0 + day % 5,
+                "min_temp": 6.0 + day % 3,
+                "app_max_temp": 13.0 + day % 5,
+                "app_min_temp": 4.0 + day % 3,
+                "rh": 70 + day % 10,
+                "pres": 1008.0,
+                "slp": 1012.0 - day % 4,
+                "clouds": (day * 17) % 100,
+                "wind_spd": 3.0 + day % 4,
+                "wind_gust_spd": 7.0 + day % 4,
+                "wind_cdir": "W",
+                "wind_dir": 270,
+                "dewpt": 5.0,
+                "pop": (day * 13) % 100,
+                "weather": _weather(500 if day % 3 == 1 else 802),
+                "vis": 20.0,
+                "precip": round((day % 3 == 1) * 2.4, 1),
+                "snow": 0.0,
+                "uv": 3.0,
+                "ozone": 310.0,
+            }
+        )
+    return {
+        "city_name": "Stubby",
+        "country_code": "DK",
+        "lat": latitude,
+        "lon": longitude,
+        "timezone": "Europe/Copenhagen",
+        "data": data,
+    }
+
+
+def generate_hourly(
+    latitude: float, longitude: float, now: datetime, hours: int
+) -> dict[str, Any]:
+    """Return an hourly forecast starting this hour."""
+    start = now.replace(minute=0, second=0, microsecond=0)
+    data = []
+    for hour in range(hours):
+        time = start + timedelta(hours=hour)
+        data.append(
+            {
+                "timestamp_utc": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "timestamp_local": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "ts": int(time.timestamp()),
+                "pod": "d" if 6 <= time.hour < 18 else "n",
+                "temp": round(10.0 + 4 * ((time.hour - 3) % 24 < 12) - hour * 0.01, 2),
+                "app_temp": 9.0,
+                "rh": 70 + hour % 10,
+                "pres": 1008.0,
+                "slp": round(1012.0 - hour * 0.05, 2),
+                "clouds": (hour * 7) % 100,
+                "wind_spd": round(3.0 + (hour % 6) * 0.4, 2),
+                "wind_gust_spd": 7.0,
+                "wind_cdir": "W",
+                "wind_dir": 270,
+                "dewpt": 5.0,
+                "pop": (hour * 11) % 100,
+                "weather": _weather(500 if hour % 8 == 3 else 802),
+                "vis": 20.0,
+                "precip": round((hour % 8 == 3) * 0.6, 1),
+                "snow": 0.0,
+                "uv": 1.0 if time.hour in range(9, 16) else 0.0,
+                "ozone": 310.0,
+            }
+        )
+    return {
+        "city_name": "Stubby",
+        "country_code": "DK",
+        "lat": latitude,
+        "lon": longitude,
+        "timezone": "Europe/Copenhagen",
+        "data": data,
+    }
+
+
+def generate_alerts(
+    latitude: float, longitude: float, now: datetime, count: int
+) -> dict[str, Any]:
+    """Return a number of alerts that started an hour ago."""
+    alerts = []
+    for index in range(count):
+        onset = now - timedelta(hours=1)
+        ends = now + timedelta(hours=6 + index)
+        alerts.append(
+            {
+                "title": f"Stub wind warning {index + 1}",
+                "description": (
+                    "English (en-GB): Strong wind expected.\n"
+                    "Dansk (da-DK): Der ventes kraftig vind."
+                ),
+                "severity": "Warning",
+                "effective_utc": onset.strftime("%Y-%m-%dT%H:%M:%S"),
+                "effective_local": onset.strftime("%Y-%m-%dT%H:%M:%S"),
+                "onset_utc": onset.strftime("%Y-%m-%dT%H:%M:%S"),
+                "onset_local": onset.strftime("%Y-%m-%dT%H:%M:%S"),
+                "ends_utc": ends.strftime("%Y-%m-%dT%H:%M:%S"),
+                "ends_local": ends.strftime("%Y-%m-%dT%H:%M:%S"),
+                "expires_utc": ends.strftime("%Y-%m-%dT%H:%M:%S"),
+                "expires_local": ends.strftime("%Y-%m-%dT%H:%M:%S"),
+                "uri": f"https://stub.invalid/alerts/{index + 1}",
+                "regions": ["Stubby"],
+            }
+        )
+    return {
+        "alerts": alerts,
+        "city_name": "Stubby",
+        "country_code": "DK",
+        "lat": latitude,
+        "lon": longitude,
+        "timezone": "Europe/Copenhagen",
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        default=DEFAULT_FIXTURES,
+        help="directory with recorded responses (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-fixtures",
+        action="store_true",
+        help="always generate responses, even if fixtures exist",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="delay of every response in ms"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random extra delay of up to ms"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="share of requests answered with HTTP 500 (0-1)",
+    )
+    parser.add_argument(
+        "--daily-limit",
+        type=int,
+        default=None,
+        help="answer with HTTP 429 after this many calls per key",
+    )
+    parser.add_argument(
+        "--invalid-key",
+        action="append",
+        default=[],
+        help="answer requests with this key with HTTP 403, can be repeated",
+    )
+    parser.add_argument(
+        "--alerts", type=int, default=0, help="number of generated alerts"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the stub server."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    stub = WeatherbitStub(
+        StubOptions(
+            fixtures=None if args.no_fixtures else args.fixtures,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            daily_limit=args.daily_limit,
+            invalid_keys=set(args.invalid_key),
+            alerts=args.alerts,
+            seed=args.seed,
+        )
+    )
+    _LOGGER.info("API address: http://%s:%s%s", args.host, args.port, API_PREFIX)
+    web.run_app(stub.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()